@@ -0,0 +1,14 @@
+// Map layer callbacks, referenced from dl.GeoJSON props as {"variable": "homeMap.<name>"}
+window.homeMap = {
+    // Draw each home as a circle marker, which Leaflet paints on the map's shared
+    // canvas (preferCanvas) instead of adding an icon element per home
+    pointToLayer: function(feature, latlng) {
+        return L.circleMarker(latlng, {
+            radius: 8,
+            color: '#ffffff',
+            weight: 2,
+            fillColor: '#667eea',
+            fillOpacity: 0.9
+        });
+    }
+};
@@ -0,0 +1,32 @@
+// Theme switching functionality; the initial theme is set before first paint
+// by the inline script in the index template (see create_app)
+(function() {
+    // Apply theme to document
+    function applyTheme(theme) {
+        if (theme === 'dark') {
+            document.documentElement.setAttribute('data-theme', 'dark');
+        } else {
+            document.documentElement.removeAttribute('data-theme');
+        }
+        localStorage.setItem('theme', theme);
+
+        // Dispatch custom event for Plotly chart updates
+        window.dispatchEvent(new CustomEvent('themechange', { detail: { theme: theme } }));
+    }
+
+    // Toggle theme
+    window.toggleTheme = function() {
+        const currentTheme = document.documentElement.getAttribute('data-theme');
+        const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+        applyTheme(newTheme);
+    };
+
+    // Listen for system theme changes
+    if (window.matchMedia) {
+        window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', function(e) {
+            if (!localStorage.getItem('theme')) {
+                applyTheme(e.matches ? 'dark' : 'light');
+            }
+        });
+    }
+})();
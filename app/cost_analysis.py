@@ -4,11 +4,20 @@ This module implements the financial calculations from the Home Purchase Calcula
 spreadsheet, computing projected costs, equity, and returns over time.
 """
 
-from dataclasses import dataclass
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
 from typing import Any
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the analysis falls back to NumPy
+    njit = None
+    prange = range
+
 # Default values from the spreadsheet
 DEFAULTS = {
     "down_payment_pct": 0.20,  # 20% down payment
@@ -23,9 +32,12 @@ DEFAULTS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class CostAnalysisParams:
-    """Parameters for cost analysis calculations."""
+    """Parameters for cost analysis calculations.
+
+    Instances are immutable so the derived loan amounts can be cached on first use.
+    """
 
     home_price: float
     down_payment_pct: float = DEFAULTS["down_payment_pct"]
@@ -38,17 +50,17 @@ class CostAnalysisParams:
     loan_term_years: int = DEFAULTS["loan_term_years"]
     maintenance_inflation: float = DEFAULTS["maintenance_inflation"]
 
-    @property
+    @cached_property
     def down_payment(self) -> float:
         """Calculate the down payment amount."""
         return self.home_price * self.down_payment_pct
 
-    @property
+    @cached_property
     def initial_loan(self) -> float:
         """Calculate the initial loan amount."""
         return self.home_price * (1 - self.down_payment_pct)
 
-    @property
+    @cached_property
     def monthly_payment(self) -> float:
         """Calculate the monthly mortgage payment using PMT formula."""
         if self.initial_loan <= 0:
@@ -57,17 +69,16 @@ class CostAnalysisParams:
         num_payments = self.loan_term_years * 12
         if monthly_rate == 0:
             return self.initial_loan / num_payments
-        return self.initial_loan * (
-            monthly_rate * (1 + monthly_rate) ** num_payments
-        ) / ((1 + monthly_rate) ** num_payments - 1)
+        compound = math.pow(1 + monthly_rate, num_payments)
+        return self.initial_loan * monthly_rate * compound / (compound - 1)
 
-    @property
+    @cached_property
     def annual_maintenance(self) -> float:
         """Calculate the base annual maintenance (HOA * 12)."""
         return self.hoa_monthly * 12
 
 
-@dataclass
+@dataclass(slots=True)
 class YearlyAnalysis:
     """Analysis results for a single year."""
 
@@ -90,6 +101,97 @@ class YearlyAnalysis:
         return self.equity / self.total_cash_invested
 
 
+_COLUMN_NAMES = tuple(field.name for field in fields(YearlyAnalysis))
+_PARAM_NAMES = tuple(field.name for field in fields(CostAnalysisParams))
+
+
+@dataclass(eq=False)
+class AnalysisColumns:
+    """Analysis results for every year, stored as one NumPy array per field.
+
+    Indexing with an int returns that year as a YearlyAnalysis and slicing returns
+    another AnalysisColumns, so results can still be used like a list of years.
+    """
+
+    year: np.ndarray
+    home_value: np.ndarray
+    loan_balance: np.ndarray
+    equity: np.ndarray
+    annual_taxes: np.ndarray
+    annual_repair: np.ndarray
+    annual_maintenance: np.ndarray
+    annual_cash_outflow: np.ndarray
+    total_cash_invested: np.ndarray
+    annual_mortgage_payment: np.ndarray
+
+    def __post_init__(self) -> None:
+        # Results may be shared through the analysis caches, so keep them read-only
+        for column in self._columns():
+            column.flags.writeable = False
+
+    @property
+    def roi(self) -> np.ndarray:
+        """Calculate ROI for every year, NaN where total cash invested is not positive."""
+        invested = np.where(self.total_cash_invested > 0, self.total_cash_invested, np.nan)
+        return self.equity / invested
+
+    def _columns(self) -> tuple[np.ndarray, ...]:
+        """Return the field arrays in YearlyAnalysis field order."""
+        return tuple(getattr(self, name) for name in _COLUMN_NAMES)
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Return the columns as plain lists keyed by field name (JSON-serializable)."""
+        return {name: column.tolist() for name, column in zip(_COLUMN_NAMES, self._columns())}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list[Any]]) -> "AnalysisColumns":
+        """Rebuild results from the output of to_dict."""
+        return cls(*(np.asarray(data[name]) for name in _COLUMN_NAMES))
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def __getitem__(self, index: int | slice) -> "YearlyAnalysis | AnalysisColumns":
+        if isinstance(index, slice):
+            return AnalysisColumns(*(column[index] for column in self._columns()))
+        return YearlyAnalysis(*(column[index].item() for column in self._columns()))
+
+    def __iter__(self) -> Iterator[YearlyAnalysis]:
+        for row in zip(*(column.tolist() for column in self._columns())):
+            yield YearlyAnalysis(*row)
+
+
+def _loan_balance_from_pmt(
+    monthly_payment: Any, monthly_rate: Any, remaining_payments: Any
+) -> Any:
+    """Present value of the remaining payments on an amortizing loan.
+
+    Works on scalars or broadcastable NumPy arrays. Uses the present value
+    formula: PV = PMT * [1 - (1+r)^-n] / r
+    """
+    if np.ndim(monthly_rate) == 0:
+        if monthly_rate == 0:
+            return monthly_payment * remaining_payments
+        return monthly_payment * (1 - (1 + monthly_rate) ** (-remaining_payments)) / monthly_rate
+
+    # Per-loan rates: interest-free loans pay down in a straight line
+    interest_free = monthly_rate == 0
+    safe_rate = np.where(interest_free, 1.0, monthly_rate)
+    amortized = monthly_payment * (1 - (1 + safe_rate) ** (-remaining_payments)) / safe_rate
+    return np.where(interest_free, monthly_payment * remaining_payments, amortized)
+
+
+def _compound_factors(rate: Any, years: int) -> np.ndarray:
+    """Return (1 + rate)**year for year 0..years, built by running multiplication.
+
+    A scalar rate gives a vector of years + 1 factors; an array of rates gives one
+    row of factors per rate.
+    """
+    factors = np.repeat(1 + np.asarray(rate, dtype=float)[..., None], years + 1, axis=-1)
+    factors[..., 0] = 1.0
+    return np.cumprod(factors, axis=-1)
+
+
 def calculate_loan_balance(
     principal: float, annual_rate: float, term_years: int, years_elapsed: int
 ) -> float:
@@ -105,96 +207,279 @@ def calculate_loan_balance(
     remaining_payments = (term_years - years_elapsed) * 12
 
     if monthly_rate == 0:
-        return principal * (remaining_payments / total_payments)
-
-    # Calculate monthly payment
-    monthly_payment = principal * (
-        monthly_rate * (1 + monthly_rate) ** total_payments
-    ) / ((1 + monthly_rate) ** total_payments - 1)
+        monthly_payment = principal / total_payments
+    else:
+        compound = math.pow(1 + monthly_rate, total_payments)
+        monthly_payment = principal * monthly_rate * compound / (compound - 1)
 
-    # Calculate present value of remaining payments (loan balance)
-    loan_balance = monthly_payment * (
-        1 - (1 + monthly_rate) ** (-remaining_payments)
-    ) / monthly_rate
+    loan_balance = _loan_balance_from_pmt(monthly_payment, monthly_rate, remaining_payments)
 
     return max(0.0, loan_balance)
 
 
-def run_analysis(params: CostAnalysisParams, years: int = 30) -> list[YearlyAnalysis]:
-    """Run cost analysis over specified number of years.
+def _batch_analysis_columns(
+    homes_params: list[CostAnalysisParams], years: int
+) -> tuple[np.ndarray, ...]:
+    """Compute the analysis columns for several homes at once with NumPy.
 
-    Args:
-        params: The cost analysis parameters
-        years: Number of years to analyze (default 30)
+    Every per-year quantity is a closed-form function of the year, so the whole
+    horizon for every home is computed as (homes, years + 1) arrays in a single
+    pass. Columns are returned in YearlyAnalysis field order, starting at
+    home_value.
+    """
+    year = np.arange(years + 1)
+
+    def per_home(values: list[float]) -> np.ndarray:
+        return np.array(values, dtype=float)[:, None]
+
+    home_price = per_home([p.home_price for p in homes_params])
+    initial_loan = per_home([p.initial_loan for p in homes_params])
+    monthly_payment = per_home([p.monthly_payment for p in homes_params])
+    loan_term_years = per_home([p.loan_term_years for p in homes_params])
+    up_front = per_home([p.down_payment + p.purchase_fees for p in homes_params])
+    annual_mortgage = monthly_payment * 12
+
+    # Home value appreciates annually
+    home_value = home_price * _compound_factors(
+        [p.annual_growth_rate for p in homes_params], years
+    )
+
+    # Remaining loan balance: present value of the payments still owed
+    balance = _loan_balance_from_pmt(
+        monthly_payment,
+        per_home([p.interest_rate / 12 for p in homes_params]),
+        (loan_term_years - year) * 12,
+    )
+    loan_balance = np.where(
+        (initial_loan > 0) & (year < loan_term_years), np.maximum(balance, 0.0), 0.0
+    )
+
+    # Equity is home value minus remaining loan
+    equity = home_value - loan_balance
+
+    # Annual costs based on current home value
+    annual_taxes = home_value * per_home([p.property_tax_rate for p in homes_params])
+    annual_repair = home_value * per_home([p.monthly_repair_pct for p in homes_params]) * 12
+
+    # Maintenance inflates over time
+    maintenance_base = per_home([p.annual_maintenance for p in homes_params])
+    annual_maintenance = maintenance_base * _compound_factors(
+        [p.maintenance_inflation for p in homes_params], years
+    )
+
+    # Cash outflow for the year (excluding mortgage principal which builds equity)
+    annual_cash_outflow = annual_taxes + annual_repair + annual_maintenance
+
+    # Year 0 is the down payment + purchase fees; every later year adds its
+    # annual costs and mortgage payments on top of the previous total
+    annual_mortgage_payment = np.where(year > 0, annual_mortgage, 0.0)
+    yearly_spend = np.where(year > 0, annual_cash_outflow, 0.0) + annual_mortgage_payment
+    total_cash_invested = up_front + np.cumsum(yearly_spend, axis=1)
+
+    return (
+        home_value,
+        loan_balance,
+        equity,
+        annual_taxes,
+        annual_repair,
+        annual_maintenance,
+        annual_cash_outflow,
+        total_cash_invested,
+        annual_mortgage_payment,
+    )
+
+
+def _analysis_columns(params: CostAnalysisParams, years: int) -> tuple[np.ndarray, ...]:
+    """Compute the analysis columns for a single home with NumPy."""
+    return tuple(column[0] for column in _batch_analysis_columns([params], years))
+
+
+def _fill_analysis_columns(
+    home_price: float,
+    down_payment_pct: float,
+    purchase_fees: float,
+    property_tax_rate: float,
+    monthly_repair_pct: float,
+    hoa_monthly: float,
+    annual_growth_rate: float,
+    interest_rate: float,
+    loan_term_years: float,
+    maintenance_inflation: float,
+    out: np.ndarray,
+) -> None:
+    """Scalar year loop over one home's analysis, compiled with Numba when installed.
+
+    Takes the CostAnalysisParams fields as plain floats so it can be JIT-compiled
+    and writes the same columns as _analysis_columns into the rows of out, which
+    has shape (9, years + 1).
+    """
+    home_value = out[0]
+    loan_balance = out[1]
+    equity = out[2]
+    annual_taxes = out[3]
+    annual_repair = out[4]
+    annual_maintenance = out[5]
+    annual_cash_outflow = out[6]
+    total_cash_invested = out[7]
+    annual_mortgage_payment = out[8]
+
+    initial_loan = home_price * (1 - down_payment_pct)
+    monthly_rate = interest_rate / 12
+    total_payments = loan_term_years * 12
+    monthly_payment = 0.0
+    # (1+r)^-remaining for the current year, stepped by (1+r)^12 each year
+    discount = 1.0
+    year_step = 1.0
+    if initial_loan > 0:
+        if monthly_rate == 0:
+            monthly_payment = initial_loan / total_payments
+        else:
+            compound = math.pow(1 + monthly_rate, total_payments)
+            monthly_payment = initial_loan * monthly_rate * compound / (compound - 1)
+            discount = 1 / compound
+            year_step = math.pow(1 + monthly_rate, 12)
+    annual_mortgage = monthly_payment * 12
+
+    running_total = home_price * down_payment_pct + purchase_fees
+    growth_factor = 1.0
+    inflation_factor = 1.0
+    for year in range(out.shape[1]):
+        home_value[year] = home_price * growth_factor
+
+        balance = 0.0
+        if initial_loan > 0 and year < loan_term_years:
+            if monthly_rate == 0:
+                balance = monthly_payment * (loan_term_years - year) * 12
+            else:
+                balance = monthly_payment * (1 - discount) / monthly_rate
+        loan_balance[year] = max(0.0, balance)
+
+        equity[year] = home_value[year] - loan_balance[year]
+        annual_taxes[year] = home_value[year] * property_tax_rate
+        annual_repair[year] = home_value[year] * monthly_repair_pct * 12
+        annual_maintenance[year] = hoa_monthly * 12 * inflation_factor
+        annual_cash_outflow[year] = (
+            annual_taxes[year] + annual_repair[year] + annual_maintenance[year]
+        )
 
-    Returns:
-        List of YearlyAnalysis objects, one per year (including year 0)
+        # Year 0 is the down payment + purchase fees; later years add their costs
+        if year == 0:
+            annual_mortgage_payment[year] = 0.0
+        else:
+            running_total += annual_cash_outflow[year] + annual_mortgage
+            annual_mortgage_payment[year] = annual_mortgage
+        total_cash_invested[year] = running_total
+
+        growth_factor *= 1 + annual_growth_rate
+        inflation_factor *= 1 + maintenance_inflation
+        discount *= year_step
+
+
+def _run_analysis_kernel(params: np.ndarray, years: int) -> np.ndarray:
+    """Run the loop kernel for one home.
+
+    params holds the CostAnalysisParams fields in declaration order; the result
+    has one row per column, shape (9, years + 1).
     """
-    results = []
-    annual_mortgage = params.monthly_payment * 12
+    out = np.empty((9, years + 1))
+    _fill_analysis_columns(
+        params[0], params[1], params[2], params[3], params[4],
+        params[5], params[6], params[7], params[8], params[9], out,
+    )
+    return out
 
-    for year in range(years + 1):
-        # Home value appreciates annually
-        home_value = params.home_price * ((1 + params.annual_growth_rate) ** year)
 
-        # Calculate remaining loan balance
-        loan_balance = calculate_loan_balance(
-            params.initial_loan, params.interest_rate, params.loan_term_years, year
+def _batch_analysis_kernel(params: np.ndarray, years: int) -> np.ndarray:
+    """Run the loop kernel for many homes, one home per thread under Numba.
+
+    params has one row of CostAnalysisParams fields per home; the result has
+    shape (9, homes, years + 1).
+    """
+    out = np.empty((9, params.shape[0], years + 1))
+    for h in prange(params.shape[0]):
+        row = params[h]
+        _fill_analysis_columns(
+            row[0], row[1], row[2], row[3], row[4],
+            row[5], row[6], row[7], row[8], row[9], out[:, h],
         )
+    return out
 
-        # Equity is home value minus remaining loan
-        equity = home_value - loan_balance
 
-        # Annual costs based on current home value
-        annual_taxes = home_value * params.property_tax_rate
-        annual_repair = home_value * params.monthly_repair_pct * 12
+if njit is not None:
+    # Explicit signatures compile (or load from the on-disk cache) at import time
+    # rather than on the first analysis request
+    _fill_analysis_columns = njit(
+        "void(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8[:, :])", cache=True, fastmath=True
+    )(_fill_analysis_columns)
+    _run_analysis_kernel = njit("f8[:, :](f8[:], i8)", cache=True, fastmath=True)(
+        _run_analysis_kernel
+    )
+    _batch_analysis_kernel = njit(
+        "f8[:, :, :](f8[:, :], i8)", parallel=True, cache=True, fastmath=True
+    )(_batch_analysis_kernel)
 
-        # Maintenance inflates over time
-        annual_maintenance = params.annual_maintenance * (
-            (1 + params.maintenance_inflation) ** year
-        )
 
-        # Cash outflow for the year (excluding mortgage principal which builds equity)
-        annual_cash_outflow = annual_taxes + annual_repair + annual_maintenance
+def _kernel_params(homes_params: list[CostAnalysisParams]) -> np.ndarray:
+    """Pack params into a float array with one row of dataclass fields per home."""
+    return np.array(
+        [[getattr(params, name) for name in _PARAM_NAMES] for params in homes_params],
+        dtype=float,
+    )
 
-        # Total cash invested calculation
-        if year == 0:
-            # Year 0: down payment + purchase fees
-            total_cash_invested = params.down_payment + params.purchase_fees
-        else:
-            # Subsequent years: previous total + annual costs + mortgage payments
-            prev_total = results[year - 1].total_cash_invested
-            total_cash_invested = (
-                prev_total
-                + annual_maintenance
-                + annual_mortgage
-                + annual_taxes
-                + annual_repair
-            )
-
-        results.append(
-            YearlyAnalysis(
-                year=year,
-                home_value=home_value,
-                loan_balance=loan_balance,
-                equity=equity,
-                annual_taxes=annual_taxes,
-                annual_repair=annual_repair,
-                annual_maintenance=annual_maintenance,
-                annual_cash_outflow=annual_cash_outflow,
-                total_cash_invested=total_cash_invested,
-                annual_mortgage_payment=annual_mortgage if year > 0 else 0,
-            )
-        )
 
-    return results
+@lru_cache(maxsize=512)
+def _run_analysis_cached(params: CostAnalysisParams, years: int) -> AnalysisColumns:
+    """Memoized body of run_analysis, keyed on the (hashable, frozen) params."""
+    if njit is not None:
+        columns = _run_analysis_kernel(_kernel_params([params])[0], years)
+    else:
+        columns = _analysis_columns(params, years)
+
+    return AnalysisColumns(np.arange(years + 1), *columns)
+
+
+def run_analysis(params: CostAnalysisParams, years: int = 30) -> AnalysisColumns:
+    """Run cost analysis over specified number of years.
+
+    Uses the Numba-compiled kernel when Numba is installed and the NumPy
+    implementation otherwise. Results are memoized by params and years, so the
+    returned arrays are read-only.
+
+    Args:
+        params: The cost analysis parameters
+        years: Number of years to analyze (default 30)
+
+    Returns:
+        AnalysisColumns with one entry per year (including year 0)
+    """
+    return _run_analysis_cached(params, years)
+
+
+@lru_cache(maxsize=128)
+def _compare_homes_cached(
+    homes_params: tuple[CostAnalysisParams, ...], years: int
+) -> tuple[AnalysisColumns, ...]:
+    """Memoized batch analysis behind compare_homes, one result per params entry."""
+    year = np.arange(years + 1)
+    if njit is not None:
+        columns = _batch_analysis_kernel(_kernel_params(list(homes_params)), years)
+    else:
+        columns = _batch_analysis_columns(list(homes_params), years)
+    return tuple(
+        AnalysisColumns(year, *(column[i] for column in columns))
+        for i in range(len(homes_params))
+    )
 
 
 def compare_homes(
     homes_params: list[tuple[str, CostAnalysisParams]], years: int = 30
-) -> dict[str, list[YearlyAnalysis]]:
+) -> dict[str, AnalysisColumns]:
     """Run analysis for multiple homes for comparison.
 
+    All homes are analyzed together as one batch of (homes, years + 1) arrays,
+    spread across threads by the Numba kernel when Numba is installed. Repeated
+    comparisons of the same params are served from a cache.
+
     Args:
         homes_params: List of (home_name, params) tuples
         years: Number of years to analyze
@@ -202,14 +487,18 @@ def compare_homes(
     Returns:
         Dictionary mapping home names to their analysis results
     """
-    return {name: run_analysis(params, years) for name, params in homes_params}
+    if not homes_params:
+        return {}
 
+    results = _compare_homes_cached(tuple(params for _, params in homes_params), years)
+    return {name: result for (name, _), result in zip(homes_params, results)}
 
-def get_analysis_summary(results: list[YearlyAnalysis]) -> dict[str, Any]:
+
+def get_analysis_summary(results: AnalysisColumns) -> dict[str, Any]:
     """Get summary statistics from analysis results.
 
     Args:
-        results: List of YearlyAnalysis objects
+        results: Analysis results from run_analysis
 
     Returns:
         Dictionary with summary statistics
@@ -220,6 +509,13 @@ def get_analysis_summary(results: list[YearlyAnalysis]) -> dict[str, Any]:
     final = results[-1]
     initial = results[0]
 
+    # One reduction over the stacked annual cost columns, skipping year 0
+    total_taxes, total_repair, total_maintenance = (
+        np.stack((results.annual_taxes, results.annual_repair, results.annual_maintenance))[:, 1:]
+        .sum(axis=1)
+        .tolist()
+    )
+
     return {
         "years_analyzed": len(results) - 1,
         "initial_investment": initial.total_cash_invested,
@@ -229,7 +525,7 @@ def get_analysis_summary(results: list[YearlyAnalysis]) -> dict[str, Any]:
         "total_appreciation": final.home_value - initial.home_value,
         "appreciation_pct": (final.home_value - initial.home_value) / initial.home_value,
         "final_roi": final.roi,
-        "total_taxes_paid": sum(r.annual_taxes for r in results[1:]),
-        "total_repair_costs": sum(r.annual_repair for r in results[1:]),
-        "total_maintenance": sum(r.annual_maintenance for r in results[1:]),
+        "total_taxes_paid": total_taxes,
+        "total_repair_costs": total_repair,
+        "total_maintenance": total_maintenance,
     }
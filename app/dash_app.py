@@ -1,16 +1,140 @@
 """Dash application for visualizing home data on a map."""
 
+import bisect
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from html import escape
 from typing import Any
 
 import dash
 import dash_leaflet as dl
-import pandas as pd
+import flask
+import numpy as np
+import orjson
 import plotly.graph_objects as go
-from dash import ALL, Input, Output, State, callback, dash_table, dcc, html
-from plotly.subplots import make_subplots
+from dash import Input, Output, State, dash_table, dcc, html
+from dash.dash_table import FormatTemplate
+from dash.dash_table.Format import Format
+from dash.exceptions import PreventUpdate
+from flask.json.provider import DefaultJSONProvider
+
+from .cost_analysis import DEFAULTS, AnalysisColumns, CostAnalysisParams, compare_homes
+from .database import (
+    HomeRecord,
+    get_all_homes,
+    get_all_homes_minimal,
+    get_db_mtime,
+    get_home_by_id,
+    get_homes_by_ids,
+    get_homes_page,
+    get_homes_version,
+    wait_for_homes_change,
+)
+
+# Shared result of the last get_all_homes() query, reused by layout renders
+_HOMES_CACHE: dict[str, Any] = {"key": None, "data": None, "version": ""}
+# Serializes rebuilds so concurrent requests share one query and never see a
+# version digest from a different build than the data
+_HOMES_CACHE_LOCK = threading.Lock()
+
+
+def _cached_homes() -> tuple[list[HomeRecord], str]:
+    """Return all homes and their digest, re-querying only after the database changed.
+
+    The cache is keyed on the in-process write counter, which the import
+    watcher bumps, and on the database file's mtime, which also moves when
+    another process writes. The rows and the digest come from one locked read,
+    so callers never pair one build's rows with another build's digest.
+    """
+    key = (get_homes_version(), get_db_mtime())
+    with _HOMES_CACHE_LOCK:
+        if _HOMES_CACHE["data"] is None or _HOMES_CACHE["key"] != key:
+            data = get_all_homes()
+            _HOMES_CACHE["data"] = data
+            _HOMES_CACHE["key"] = key
+            _HOMES_CACHE["version"] = hashlib.blake2b(repr(data).encode(), digest_size=8).hexdigest()
+        return _HOMES_CACHE["data"], _HOMES_CACHE["version"]
+
+
+def _cached_homes_version() -> str:
+    """Return a digest of the cached homes, which changes whenever any row does."""
+    return _cached_homes()[1]
+
+
+def _invalidate_homes_cache() -> None:
+    """Force the next _cached_homes() call to re-query the database."""
+    with _HOMES_CACHE_LOCK:
+        _HOMES_CACHE["data"] = None
+
 
-from .cost_analysis import DEFAULTS, CostAnalysisParams, run_analysis
-from .database import get_all_homes, get_home_by_id, init_db
+def _homes_data_update(current: dict[str, str] | None) -> dict[str, str]:
+    """Return the new homes-data value, or skip the update if no row changed.
+
+    Every list, map and count callback hangs off homes-data, so an unchanged
+    digest stops all of them from rebuilding identical output.
+    """
+    version = _cached_homes_version()
+    if current and current.get("version") == version:
+        raise PreventUpdate
+    return {"version": version}
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used for the /api/homes* routes.
+
+    orjson encodes the HomeRecord dataclasses, NumPy values and dates (as ISO
+    8601) natively; only other types reach DefaultJSONProvider.default. Dash
+    callback responses are encoded by Plotly, whose "auto" JSON engine also
+    picks orjson up.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON from ``s``."""
+        return orjson.loads(s)
+
+
+# Assets load at the end of <body>, so the saved or system theme is set by a
+# tiny inline script before first paint; the toggle lives in assets/theme.js.
+# Built once per process and shared by every create_app() call
+_INDEX_STRING = """<!DOCTYPE html>
+<html>
+    <head>
+        {%metas%}
+        <title>{%title%}</title>
+        {%favicon%}
+        {%css%}
+        <script>
+            (function() {
+                var theme = localStorage.getItem('theme');
+                if (!theme && window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches) {
+                    theme = 'dark';
+                }
+                if (theme === 'dark') {
+                    document.documentElement.setAttribute('data-theme', 'dark');
+                }
+            })();
+        </script>
+    </head>
+    <body>
+        {%app_entry%}
+        <footer>
+            {%config%}
+            {%scripts%}
+            {%renderer%}
+        </footer>
+    </body>
+</html>
+"""
 
 
 def create_app() -> dash.Dash:
@@ -19,728 +143,38 @@ def create_app() -> dash.Dash:
         __name__,
         title="Vibe House Shopping",
         suppress_callback_exceptions=True,
+        # gzip/brotli the layout, callback JSON and component bundles (flask-compress)
+        compress=True,
     )
+    app.server.json = OrjsonProvider(app.server)
 
     app.layout = html.Div(
         [
             dcc.Location(id="url", refresh=False),
             html.Div(id="page-content"),
-            # Hidden div for storing data
-            dcc.Store(id="homes-data", data=get_all_homes()),
+            # Version token for the homes data; the rows stay server-side (see /api/homes).
+            # It starts empty so building the app does not query the database; the
+            # list page callbacks load the rows on first render
+            dcc.Store(id="homes-data", data=None),
             # Store for current theme (light or dark)
             dcc.Store(id="theme-store", data="light"),
-            # Interval for auto-refresh (every 30 seconds)
-            dcc.Interval(id="auto-refresh", interval=30000, n_intervals=0),
+            # Latest homes version pushed by the server over /events
+            dcc.Store(id="homes-events"),
         ],
         className="app-container",
     )
 
-    # Add CSS styles
-    app.index_string = """
-    <!DOCTYPE html>
-    <html>
-        <head>
-            {%metas%}
-            <title>{%title%}</title>
-            {%favicon%}
-            {%css%}
-            <style>
-                /* CSS Variables for theming */
-                :root {
-                    /* Light mode (default) */
-                    --bg-primary: #f5f5f5;
-                    --bg-secondary: #ffffff;
-                    --bg-tertiary: #f8f9fa;
-                    --bg-hover: #f0f0f0;
-                    --bg-alt: #fafafa;
-                    --text-primary: #333333;
-                    --text-secondary: #666666;
-                    --text-tertiary: #888888;
-                    --text-description: #444444;
-                    --border-primary: #eeeeee;
-                    --border-secondary: #dddddd;
-                    --border-tertiary: #dee2e6;
-                    --border-light: #f0f0f0;
-                    --accent-primary: #667eea;
-                    --accent-secondary: #764ba2;
-                    --accent-hover: #5a6fd6;
-                    --shadow-color: rgba(0, 0, 0, 0.1);
-                    --shadow-light: rgba(0, 0, 0, 0.05);
-                    --popup-text: #2d3748;
-                    --table-footer-bg: #e8e8e8;
-                    --table-footer-border: #cccccc;
-                    --tooltip-bg: #333333;
-                    --tooltip-text: #ffffff;
-                    --chart-template: plotly_white;
-                }
-
-                [data-theme="dark"] {
-                    /* Dark mode */
-                    --bg-primary: #1a1a2e;
-                    --bg-secondary: #16213e;
-                    --bg-tertiary: #1f2940;
-                    --bg-hover: #253550;
-                    --bg-alt: #1c2a3f;
-                    --text-primary: #e8e8e8;
-                    --text-secondary: #b0b0b0;
-                    --text-tertiary: #888888;
-                    --text-description: #c0c0c0;
-                    --border-primary: #2a3a50;
-                    --border-secondary: #3a4a60;
-                    --border-tertiary: #3a4a60;
-                    --border-light: #2a3a50;
-                    --accent-primary: #7c8ff8;
-                    --accent-secondary: #9b6dd4;
-                    --accent-hover: #8a9cf8;
-                    --shadow-color: rgba(0, 0, 0, 0.3);
-                    --shadow-light: rgba(0, 0, 0, 0.2);
-                    --popup-text: #e8e8e8;
-                    --table-footer-bg: #253550;
-                    --table-footer-border: #3a4a60;
-                    --tooltip-bg: #e8e8e8;
-                    --tooltip-text: #1a1a2e;
-                    --chart-template: plotly_dark;
-                }
-
-                * {
-                    box-sizing: border-box;
-                    margin: 0;
-                    padding: 0;
-                }
-                body {
-                    font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    background-color: var(--bg-primary);
-                    color: var(--text-primary);
-                    transition: background-color 0.3s ease, color 0.3s ease;
-                }
-                .app-container {
-                    max-width: 1800px;
-                    margin: 0 auto;
-                    padding: 20px 40px;
-                    width: 100%;
-                }
-                .controls {
-                    display: flex;
-                    align-items: center;
-                    gap: 20px;
-                    margin-bottom: 20px;
-                }
-                .refresh-button {
-                    background-color: var(--accent-primary);
-                    color: white;
-                    border: none;
-                    padding: 12px 24px;
-                    font-size: 1rem;
-                    border-radius: 8px;
-                    cursor: pointer;
-                    transition: background-color 0.2s;
-                }
-                .refresh-button:hover {
-                    background-color: var(--accent-hover);
-                }
-                .home-count {
-                    font-size: 1.1rem;
-                    color: var(--text-secondary);
-                }
-                .main-content {
-                    display: flex;
-                    flex-direction: column;
-                    gap: 30px;
-                    width: 100%;
-                }
-                .map-container, .table-container {
-                    background: var(--bg-secondary);
-                    padding: 25px;
-                    border-radius: 12px;
-                    box-shadow: 0 2px 10px var(--shadow-color);
-                    width: 100%;
-                    transition: background-color 0.3s ease, box-shadow 0.3s ease;
-                }
-                .map-container h2, .table-container h2 {
-                    margin-bottom: 15px;
-                    color: var(--text-primary);
-                }
-                .leaflet-popup-content {
-                    font-family: system-ui, -apple-system, sans-serif;
-                }
-                .popup-content {
-                    line-height: 1.6;
-                }
-                .popup-content strong {
-                    color: var(--accent-primary);
-                }
-                .popup-price {
-                    font-size: 1.2rem;
-                    font-weight: bold;
-                    color: var(--popup-text);
-                    margin-bottom: 8px;
-                }
-                .popup-address {
-                    font-weight: 600;
-                    margin-bottom: 8px;
-                }
-                .popup-details {
-                    color: var(--text-secondary);
-                    font-size: 0.9rem;
-                }
-                .home-link {
-                    color: var(--accent-primary);
-                    text-decoration: none;
-                    cursor: pointer;
-                }
-                .home-link:hover {
-                    text-decoration: underline;
-                }
-                .back-link {
-                    display: inline-block;
-                    margin-bottom: 20px;
-                    color: var(--accent-primary);
-                    text-decoration: none;
-                    font-size: 1rem;
-                }
-                .back-link:hover {
-                    text-decoration: underline;
-                }
-                .detail-container {
-                    background: var(--bg-secondary);
-                    padding: 30px 40px;
-                    border-radius: 12px;
-                    box-shadow: 0 2px 10px var(--shadow-color);
-                    margin-bottom: 20px;
-                    width: 100%;
-                    transition: background-color 0.3s ease, box-shadow 0.3s ease;
-                }
-                .detail-header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: flex-start;
-                    margin-bottom: 30px;
-                    flex-wrap: wrap;
-                    gap: 20px;
-                }
-                .detail-title {
-                    font-size: 1.8rem;
-                    color: var(--text-primary);
-                    margin-bottom: 8px;
-                }
-                .detail-location {
-                    font-size: 1.1rem;
-                    color: var(--text-secondary);
-                }
-                .detail-price {
-                    font-size: 2.2rem;
-                    font-weight: bold;
-                    color: var(--accent-primary);
-                }
-                .detail-grid {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }
-                .detail-item {
-                    padding: 15px;
-                    background: var(--bg-tertiary);
-                    border-radius: 8px;
-                    transition: background-color 0.3s ease;
-                }
-                .detail-label {
-                    font-size: 0.85rem;
-                    color: var(--text-secondary);
-                    text-transform: uppercase;
-                    letter-spacing: 0.5px;
-                    margin-bottom: 5px;
-                }
-                .detail-value {
-                    font-size: 1.2rem;
-                    font-weight: 600;
-                    color: var(--text-primary);
-                }
-                .detail-section {
-                    margin-bottom: 30px;
-                }
-                .detail-section h3 {
-                    font-size: 1.2rem;
-                    color: var(--text-primary);
-                    margin-bottom: 15px;
-                    padding-bottom: 10px;
-                    border-bottom: 2px solid var(--border-primary);
-                }
-                .detail-description {
-                    line-height: 1.7;
-                    color: var(--text-description);
-                    white-space: pre-wrap;
-                }
-                .detail-map {
-                    height: 300px;
-                    border-radius: 8px;
-                    margin-top: 15px;
-                }
-                .detail-meta {
-                    font-size: 0.9rem;
-                    color: var(--text-tertiary);
-                }
-                .detail-meta a {
-                    color: var(--accent-primary);
-                    text-decoration: none;
-                }
-                .detail-meta a:hover {
-                    text-decoration: underline;
-                }
-                .not-found {
-                    text-align: center;
-                    padding: 60px 20px;
-                }
-                .not-found h2 {
-                    font-size: 1.5rem;
-                    color: var(--text-secondary);
-                    margin-bottom: 20px;
-                }
-                table {
-                    width: 100%;
-                    border-collapse: collapse;
-                }
-                th, td {
-                    padding: 12px 10px;
-                    text-align: left;
-                    border-bottom: 1px solid var(--border-primary);
-                }
-                th {
-                    background-color: var(--bg-tertiary);
-                    font-weight: 600;
-                    color: var(--text-primary);
-                    border-bottom: 2px solid var(--border-tertiary);
-                }
-                tr:hover {
-                    background-color: var(--bg-tertiary);
-                }
-                tbody tr:nth-child(odd) {
-                    background-color: var(--bg-alt);
-                }
-                tbody tr:nth-child(odd):hover {
-                    background-color: var(--bg-hover);
-                }
-                /* Navigation styles */
-                .nav-bar {
-                    display: flex;
-                    align-items: center;
-                    justify-content: space-between;
-                    gap: 20px;
-                    margin-bottom: 20px;
-                    padding: 12px 20px;
-                    background: linear-gradient(135deg, var(--accent-primary) 0%, var(--accent-secondary) 100%);
-                    border-radius: 8px;
-                    box-shadow: 0 2px 5px var(--shadow-color);
-                }
-                .nav-title {
-                    font-size: 1.4rem;
-                    font-weight: 600;
-                    color: white;
-                }
-                .nav-links {
-                    display: flex;
-                    gap: 10px;
-                }
-                .nav-link {
-                    color: rgba(255,255,255,0.9);
-                    text-decoration: none;
-                    font-weight: 500;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    transition: background-color 0.2s;
-                }
-                .nav-link:hover {
-                    background-color: rgba(255,255,255,0.15);
-                    color: white;
-                }
-                .nav-link.active {
-                    background-color: rgba(255,255,255,0.25);
-                    color: white;
-                }
-                /* Cost Analysis Page Styles */
-                .analysis-container {
-                    display: grid;
-                    grid-template-columns: 320px 1fr;
-                    gap: 30px;
-                    width: 100%;
-                }
-                .analysis-sidebar {
-                    background: var(--bg-secondary);
-                    padding: 20px;
-                    border-radius: 12px;
-                    box-shadow: 0 2px 10px var(--shadow-color);
-                    height: fit-content;
-                    position: sticky;
-                    top: 20px;
-                    transition: background-color 0.3s ease, box-shadow 0.3s ease;
-                }
-                .analysis-main {
-                    background: var(--bg-secondary);
-                    padding: 25px 30px;
-                    border-radius: 12px;
-                    box-shadow: 0 2px 10px var(--shadow-color);
-                    min-width: 0;
-                    overflow: hidden;
-                    flex: 1;
-                    transition: background-color 0.3s ease, box-shadow 0.3s ease;
-                }
-                .param-group {
-                    margin-bottom: 20px;
-                }
-                .param-group h4 {
-                    margin-bottom: 10px;
-                    color: var(--text-primary);
-                    font-size: 0.95rem;
-                }
-                .param-input {
-                    display: flex;
-                    flex-direction: column;
-                    margin-bottom: 12px;
-                }
-                .param-input label {
-                    font-size: 0.85rem;
-                    color: var(--text-secondary);
-                    margin-bottom: 4px;
-                }
-                .param-input input, .param-input select {
-                    padding: 8px 12px;
-                    border: 1px solid var(--border-secondary);
-                    border-radius: 6px;
-                    font-size: 0.95rem;
-                    background-color: var(--bg-secondary);
-                    color: var(--text-primary);
-                    transition: background-color 0.3s ease, border-color 0.3s ease, color 0.3s ease;
-                }
-                .param-input input:focus, .param-input select:focus {
-                    outline: none;
-                    border-color: var(--accent-primary);
-                }
-                .home-checkbox-list {
-                    max-height: 200px;
-                    overflow-y: auto;
-                    border: 1px solid var(--border-primary);
-                    border-radius: 6px;
-                    padding: 10px;
-                    background-color: var(--bg-secondary);
-                    transition: background-color 0.3s ease, border-color 0.3s ease;
-                }
-                .home-checkbox-item {
-                    display: flex;
-                    align-items: center;
-                    padding: 8px 0;
-                    border-bottom: 1px solid var(--border-light);
-                    overflow: hidden;
-                }
-                .home-checkbox-item .home-link {
-                    white-space: nowrap;
-                    overflow: hidden;
-                    text-overflow: ellipsis;
-                    flex: 1;
-                    min-width: 0;
-                }
-                .home-checkbox-item:last-child {
-                    border-bottom: none;
-                }
-                .home-checkbox-item input {
-                    margin-right: 10px;
-                }
-                .home-checkbox-item label {
-                    font-size: 0.9rem;
-                    cursor: pointer;
-                }
-                .chart-tabs {
-                    display: flex;
-                    gap: 5px;
-                    margin-bottom: 20px;
-                    border-bottom: 2px solid var(--border-primary);
-                    padding-bottom: 0;
-                }
-                .chart-tab {
-                    padding: 10px 20px;
-                    border: none;
-                    background: none;
-                    cursor: pointer;
-                    font-size: 0.95rem;
-                    color: var(--text-secondary);
-                    border-bottom: 2px solid transparent;
-                    margin-bottom: -2px;
-                    transition: all 0.2s;
-                }
-                .chart-tab:hover {
-                    color: var(--accent-primary);
-                }
-                .chart-tab.active {
-                    color: var(--accent-primary);
-                    border-bottom-color: var(--accent-primary);
-                    font-weight: 500;
-                }
-                .slider-container {
-                    margin-top: 10px;
-                }
-                .slider-value {
-                    text-align: center;
-                    font-weight: 500;
-                    color: var(--accent-primary);
-                    margin-top: 5px;
-                }
-                .summary-cards {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
-                    gap: 15px;
-                    margin-bottom: 20px;
-                }
-                .summary-card {
-                    background: var(--bg-tertiary);
-                    padding: 15px;
-                    border-radius: 8px;
-                    transition: background-color 0.3s ease;
-                }
-                .summary-card .card-title {
-                    font-weight: 600;
-                    margin-bottom: 10px;
-                    font-size: 0.85rem;
-                }
-                .summary-card table {
-                    width: 100%;
-                    border-collapse: collapse;
-                }
-                .summary-card td {
-                    padding: 4px 0;
-                    border: none;
-                }
-                .summary-card td.label {
-                    font-size: 0.8rem;
-                    color: var(--text-secondary);
-                    text-transform: uppercase;
-                    text-align: left;
-                }
-                .summary-card td.value {
-                    font-size: 1rem;
-                    font-weight: 600;
-                    color: var(--text-primary);
-                    text-align: right;
-                }
-                .no-homes-message {
-                    padding: 40px;
-                    text-align: center;
-                    color: var(--text-secondary);
-                }
-                /* Data table styles */
-                .data-table-container {
-                    margin-top: 30px;
-                    overflow-x: auto;
-                }
-                .data-table-container h3 {
-                    margin-bottom: 15px;
-                    color: var(--text-primary);
-                    font-size: 1.1rem;
-                }
-                .data-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    font-size: 0.85rem;
-                }
-                .data-table th, .data-table td {
-                    padding: 8px 12px;
-                    text-align: right;
-                    border: 1px solid var(--border-secondary);
-                    white-space: nowrap;
-                }
-                .data-table th {
-                    background-color: var(--bg-tertiary);
-                    font-weight: 600;
-                    color: var(--text-primary);
-                    position: sticky;
-                    top: 0;
-                }
-                .data-table th:first-child, .data-table td:first-child {
-                    text-align: left;
-                    position: sticky;
-                    left: 0;
-                    background-color: var(--bg-tertiary);
-                    z-index: 1;
-                }
-                .data-table tbody tr:nth-child(odd) {
-                    background-color: var(--bg-alt);
-                }
-                .data-table tbody tr:nth-child(odd) td:first-child {
-                    background-color: var(--bg-alt);
-                }
-                .data-table tbody tr:hover {
-                    background-color: var(--bg-hover);
-                }
-                .data-table tbody tr:hover td:first-child {
-                    background-color: var(--bg-hover);
-                }
-                .data-table tfoot td {
-                    font-weight: 600;
-                    background-color: var(--table-footer-bg);
-                    border-top: 2px solid var(--table-footer-border);
-                }
-                .data-table tfoot td:first-child {
-                    background-color: var(--table-footer-bg);
-                }
-                /* Tooltip styling for data cells */
-                .data-table td[title] {
-                    position: relative;
-                    cursor: help;
-                }
-                .data-table td[title]:hover::after {
-                    content: attr(title);
-                    position: absolute;
-                    bottom: 100%;
-                    left: 50%;
-                    transform: translateX(-50%);
-                    background: var(--tooltip-bg);
-                    color: var(--tooltip-text);
-                    padding: 4px 8px;
-                    border-radius: 4px;
-                    font-size: 0.75rem;
-                    white-space: nowrap;
-                    z-index: 10;
-                    pointer-events: none;
-                }
-                .data-table td[title]:hover::before {
-                    content: '';
-                    position: absolute;
-                    bottom: 100%;
-                    left: 50%;
-                    transform: translateX(-50%) translateY(6px);
-                    border: 5px solid transparent;
-                    border-top-color: var(--tooltip-bg);
-                    z-index: 10;
-                }
-                @media (max-width: 900px) {
-                    .analysis-container {
-                        grid-template-columns: 1fr;
-                    }
-                    .analysis-sidebar {
-                        position: static;
-                    }
-                }
-
-                /* Theme toggle button */
-                .theme-toggle {
-                    background: rgba(255, 255, 255, 0.2);
-                    border: none;
-                    padding: 8px 12px;
-                    border-radius: 6px;
-                    cursor: pointer;
-                    font-size: 1.1rem;
-                    transition: background-color 0.2s;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                }
-                .theme-toggle:hover {
-                    background: rgba(255, 255, 255, 0.3);
-                }
-                .theme-toggle .icon-sun,
-                .theme-toggle .icon-moon {
-                    display: none;
-                }
-                :root .theme-toggle .icon-moon {
-                    display: inline;
-                }
-                [data-theme="dark"] .theme-toggle .icon-sun {
-                    display: inline;
-                }
-                [data-theme="dark"] .theme-toggle .icon-moon {
-                    display: none;
-                }
-
-                /* Dash slider component styling for dark mode */
-                [data-theme="dark"] .rc-slider-track {
-                    background-color: var(--accent-primary);
-                }
-                [data-theme="dark"] .rc-slider-handle {
-                    border-color: var(--accent-primary);
-                    background-color: var(--bg-secondary);
-                }
-                [data-theme="dark"] .rc-slider-rail {
-                    background-color: var(--border-secondary);
-                }
-                [data-theme="dark"] .rc-slider-mark-text {
-                    color: var(--text-secondary);
-                }
-
-                /* Plotly chart dark mode styling */
-                [data-theme="dark"] .js-plotly-plot .plotly .modebar-btn path {
-                    fill: var(--text-secondary);
-                }
-                [data-theme="dark"] .js-plotly-plot .plotly .modebar-btn:hover path {
-                    fill: var(--text-primary);
-                }
-            </style>
-            <script>
-                // Theme switching functionality
-                (function() {
-                    // Check for saved theme preference or default to system preference
-                    function getPreferredTheme() {
-                        const savedTheme = localStorage.getItem('theme');
-                        if (savedTheme) {
-                            return savedTheme;
-                        }
-                        // Check system preference
-                        if (window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches) {
-                            return 'dark';
-                        }
-                        return 'light';
-                    }
-
-                    // Apply theme to document
-                    function applyTheme(theme) {
-                        if (theme === 'dark') {
-                            document.documentElement.setAttribute('data-theme', 'dark');
-                        } else {
-                            document.documentElement.removeAttribute('data-theme');
-                        }
-                        localStorage.setItem('theme', theme);
-
-                        // Dispatch custom event for Plotly chart updates
-                        window.dispatchEvent(new CustomEvent('themechange', { detail: { theme: theme } }));
-                    }
-
-                    // Toggle theme
-                    window.toggleTheme = function() {
-                        const currentTheme = document.documentElement.getAttribute('data-theme');
-                        const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-                        applyTheme(newTheme);
-                    };
-
-                    // Apply theme on page load
-                    applyTheme(getPreferredTheme());
-
-                    // Listen for system theme changes
-                    if (window.matchMedia) {
-                        window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', function(e) {
-                            if (!localStorage.getItem('theme')) {
-                                applyTheme(e.matches ? 'dark' : 'light');
-                            }
-                        });
-                    }
-                })();
-            </script>
-        </head>
-        <body>
-            {%app_entry%}
-            <footer>
-                {%config%}
-                {%scripts%}
-                {%renderer%}
-            </footer>
-        </body>
-    </html>
-    """
+    app.index_string = _INDEX_STRING
 
-    # Register callbacks
+    # Register routes and callbacks
+    register_routes(app)
     register_callbacks(app)
 
     return app
 
 
-def create_nav_bar(active_page: str = "homes") -> html.Div:
-    """Create the navigation bar with site title, nav links, and theme toggle."""
+def _make_nav(active_page: str) -> html.Div:
+    """Build the navigation bar with site title, nav links, and theme toggle."""
     return html.Div([
         html.Span("Vibe House Shopping", className="nav-title"),
         html.Div([
@@ -759,23 +193,139 @@ def create_nav_bar(active_page: str = "homes") -> html.Div:
     ], className="nav-bar")
 
 
+# Static subtrees depend only on the page, so they are built once and shared
+_NAV_HOMES = _make_nav("homes")
+_NAV_ANALYSIS = _make_nav("analysis")
+
+_HEADER_HOMES = html.Div(
+    [
+        html.Button(
+            "Refresh Data",
+            id="refresh-button",
+            className="refresh-button",
+        ),
+        html.Span(id="home-count", className="home-count"),
+    ],
+    className="controls",
+)
+
+_NO_HOMES_LAYOUT = html.Div([
+    _NAV_ANALYSIS,
+    html.Div([
+        html.H3("No homes available for analysis"),
+        html.P("Import some home listings with prices to use the cost analysis feature."),
+    ], className="no-homes-message"),
+])
+
+
+def create_nav_bar(active_page: str = "homes") -> html.Div:
+    """Return the navigation bar with the given page's link marked active."""
+    return _NAV_HOMES if active_page == "homes" else _NAV_ANALYSIS
+
+
+_HOME_TABLE_COLUMNS = [
+    {"id": "address", "name": "Address", "presentation": "markdown"},
+    {"id": "city", "name": "City"},
+    {"id": "state", "name": "State/Prov"},
+    {"id": "price", "name": "Price", "type": "numeric", "format": FormatTemplate.money(0)},
+    {"id": "bedrooms", "name": "Beds", "type": "numeric"},
+    {"id": "bathrooms", "name": "Baths", "type": "numeric"},
+    {"id": "sqft", "name": "Sq Ft", "type": "numeric", "format": Format().group(True)},
+    {"id": "num_rooms", "name": "Rooms", "type": "numeric"},
+    {"id": "garage_spaces", "name": "Garage", "type": "numeric"},
+    {"id": "year_built", "name": "Year Built", "type": "numeric"},
+    {"id": "property_type", "name": "Type"},
+    {"id": "mls_id", "name": "MLS #"},
+]
+
+# DataTable filter_query operators, longest first so ">=" wins over ">"
+_FILTER_OPERATORS = (
+    (">=", ">="), ("<=", "<="), ("!=", "!="), ("=", "="), (">", ">"), ("<", "<"),
+    ("ge", ">="), ("le", "<="), ("ne", "!="), ("eq", "="), ("gt", ">"), ("lt", "<"),
+    ("contains", "contains"),
+)
+
+# Operators that have a case-insensitive ("i"-prefixed) database counterpart
+_CASE_OPERATORS = frozenset(("=", "!=", "contains"))
+
+# Only these columns compare against numbers; text columns keep values as typed
+_NUMERIC_COLUMNS = frozenset(col["id"] for col in _HOME_TABLE_COLUMNS if col.get("type") == "numeric")
+
+
+def _parse_filter_query(filter_query: str | None) -> list[tuple[str, str, Any]]:
+    """Parse a DataTable filter_query into (column, operator, value) triples.
+
+    Handles the expressions the table's per-column filter boxes produce,
+    e.g. ``{price} > 400000 && {city} scontains "Van"``. The table prefixes
+    operators with "s" (case-sensitive) or "i" (case-insensitive); the "i"
+    forms come back as "icontains", "i=" and "i!=".
+    """
+    filters = []
+    for part in (filter_query or "").split(" && "):
+        part = part.strip()
+        if not part.startswith("{") or "}" not in part:
+            continue
+        column, _, rest = part[1:].partition("}")
+        rest = rest.strip()
+        case = ""
+        if rest[:1] in ("s", "i"):
+            case, rest = rest[0], rest[1:]
+        for token, operator in _FILTER_OPERATORS:
+            if rest.startswith(token):
+                value = rest[len(token):].strip()
+                if value[:1] == value[-1:] and value[:1] in ('"', "'", "`"):
+                    value = value[1:-1]
+                elif column in _NUMERIC_COLUMNS and operator != "contains":
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+                if case == "i" and operator in _CASE_OPERATORS:
+                    operator = "i" + operator
+                filters.append((column, operator, value))
+                break
+    return filters
+
+
+# Map zoom by coordinate spread in degrees: spreads below _ZOOM_THRESHOLDS[i]
+# get _ZOOM_LEVELS[i], anything wider gets the last level
+_ZOOM_THRESHOLDS = (0.01, 0.05, 0.1, 0.5, 1, 5)
+_ZOOM_LEVELS = (15, 13, 12, 10, 9, 7, 5)
+
+
+def _map_viewport(homes: list[HomeRecord]) -> dict[str, Any]:
+    """Return a map viewport that centers on and fits the located homes.
+
+    Note: We use the 'viewport' property instead of 'center'/'zoom' because
+    dash-leaflet's center and zoom props are immutable after initial render.
+    The viewport property allows dynamic updates after the map is mounted.
+    """
+    # One pass pulls the located homes' coordinates; the reductions run in numpy
+    coords = np.fromiter(
+        (coord for home in homes if home.latitude and home.longitude for coord in (home.latitude, home.longitude)),
+        dtype=np.float64,
+    ).reshape(-1, 2)
+
+    if not len(coords):
+        return dict(center=[39.8283, -98.5795], zoom=4, transition="flyTo")
+
+    center_lat, center_lng = coords.mean(axis=0).tolist()
+
+    # Calculate appropriate zoom level based on spread
+    spread = float(np.ptp(coords, axis=0).max())
+
+    zoom = _ZOOM_LEVELS[bisect.bisect_right(_ZOOM_THRESHOLDS, spread)]
+
+    return dict(center=[center_lat, center_lng], zoom=zoom, transition="flyTo")
+
+
 def create_home_list_layout() -> html.Div:
     """Create the main home listing layout."""
     return html.Div([
         # Navigation
         create_nav_bar("homes"),
         # Refresh button and stats
-        html.Div(
-            [
-                html.Button(
-                    "Refresh Data",
-                    id="refresh-button",
-                    className="refresh-button",
-                ),
-                html.Span(id="home-count", className="home-count"),
-            ],
-            className="controls",
-        ),
+        _HEADER_HOMES,
         # Main content area
         html.Div(
             [
@@ -787,9 +337,19 @@ def create_home_list_layout() -> html.Div:
                             id="home-map",
                             center=[39.8283, -98.5795],  # Center of US
                             zoom=4,
+                            # Draw vector layers (the home circles) on one canvas
+                            preferCanvas=True,
                             children=[
                                 dl.TileLayer(),
-                                dl.LayerGroup(id="marker-layer"),
+                                # Clustered in the browser by supercluster; single
+                                # homes are circle markers (see assets/map.js)
+                                dl.GeoJSON(
+                                    id="marker-layer",
+                                    cluster=True,
+                                    zoomToBoundsOnClick=True,
+                                    superClusterOptions={"radius": 100},
+                                    pointToLayer={"variable": "homeMap.pointToLayer"},
+                                ),
                             ],
                             style={
                                 "width": "100%",
@@ -804,7 +364,40 @@ def create_home_list_layout() -> html.Div:
                 html.Div(
                     [
                         html.H2("All Homes"),
-                        html.Div(id="homes-list"),
+                        html.P(
+                            "No homes in database. Drop HTML files into the import/ directory to add homes.",
+                            id="homes-list-empty",
+                            style={"display": "none"},
+                        ),
+                        # Paged, sorted and filtered in SQL; only the visible page is sent
+                        dash_table.DataTable(
+                            id="homes-list",
+                            columns=_HOME_TABLE_COLUMNS,
+                            page_action="custom",
+                            page_current=0,
+                            page_size=50,
+                            sort_action="custom",
+                            sort_mode="single",
+                            sort_by=[],
+                            filter_action="custom",
+                            filter_query="",
+                            style_as_list_view=True,
+                            style_table={"overflowX": "auto"},
+                            style_header={
+                                "backgroundColor": "var(--bg-tertiary)",
+                                "color": "var(--text-primary)",
+                                "fontWeight": "600",
+                            },
+                            style_filter={"backgroundColor": "var(--bg-secondary)"},
+                            style_cell={
+                                "textAlign": "left",
+                                "padding": "12px 10px",
+                                "fontSize": "0.95rem",
+                                "backgroundColor": "var(--bg-secondary)",
+                                "color": "var(--text-primary)",
+                                "borderBottom": "1px solid var(--border-primary)",
+                            },
+                        ),
                     ],
                     className="table-container",
                 ),
@@ -814,6 +407,51 @@ def create_home_list_layout() -> html.Div:
     ])
 
 
+# Bound str.format methods for the hot number formats; table columns are
+# formatted with map() over these, which skips the per-cell bytecode
+_fmt_usd = "${:,.0f}".format
+_fmt_decimal = "{:,.2f}".format
+_fmt_roi = "{:.2f}x".format
+
+
+def _fmt_text(value: Any) -> str:
+    """Format a plain detail value, or a dash when missing."""
+    return str(value or "—")
+
+
+def _fmt_thousands(value: Any) -> str:
+    """Format a count with thousands separators, or a dash when missing."""
+    return f"{value:,}" if value else "—"
+
+
+def _fmt_acres(value: Any) -> str:
+    """Format a lot size in acres, or a dash when missing."""
+    return f"{value:.2f} acres" if value else "—"
+
+
+# Backslash escapes for the characters markdown reads as inline syntax
+_MARKDOWN_ESCAPES = str.maketrans({char: "\\" + char for char in "\\`*_[]()<>!~|#"})
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape scraped text so markdown cells render it literally."""
+    return text.translate(_MARKDOWN_ESCAPES)
+
+
+# (label, home field, formatter) for each cell of the detail grid
+_DETAIL_FIELDS = (
+    ("Bedrooms", "bedrooms", _fmt_text),
+    ("Bathrooms", "bathrooms", _fmt_text),
+    ("Total Rooms", "num_rooms", _fmt_text),
+    ("Square Feet", "sqft", _fmt_thousands),
+    ("Garage Spaces", "garage_spaces", _fmt_text),
+    ("Lot Size", "lot_size", _fmt_acres),
+    ("Year Built", "year_built", _fmt_text),
+    ("Property Type", "property_type", _fmt_text),
+    ("MLS #", "mls_id", _fmt_text),
+)
+
+
 def create_home_detail_layout(home_id: int) -> html.Div:
     """Create the detail view layout for a single home."""
     home = get_home_by_id(home_id)
@@ -827,40 +465,26 @@ def create_home_detail_layout(home_id: int) -> html.Div:
             ], className="not-found"),
         ])
 
-    # Format values
-    price_str = f"${home['price']:,.0f}" if home.get("price") else "Price not available"
-    beds = str(home.get("bedrooms") or "—")
-    baths = str(home.get("bathrooms") or "—")
-    sqft = f"{home['sqft']:,}" if home.get("sqft") else "—"
-    lot_size = f"{home['lot_size']:.2f} acres" if home.get("lot_size") else "—"
-    year_built = str(home.get("year_built") or "—")
-    prop_type = home.get("property_type") or "—"
-    num_rooms = str(home.get("num_rooms") or "—")
-    garage = str(home.get("garage_spaces") or "—")
-    mls_id = home.get("mls_id") or "—"
+    # Key on the row contents so an edited home never gets a stale layout
+    return _build_home_detail(tuple(home.items()))
+
+
+@lru_cache(maxsize=256)
+def _build_home_detail(home_items: tuple[tuple[str, Any], ...]) -> html.Div:
+    """Build the detail layout for a home row (memoized on the row's values)."""
+    home = dict(home_items)
+
+    price_str = _fmt_usd(home["price"]) if home.get("price") else "Price not available"
 
     location_parts = [p for p in [home.get("city"), home.get("state"), home.get("zip_code")] if p]
     location_str = ", ".join(location_parts) if location_parts else ""
 
-    # Build the detail grid items
-    detail_items = [
-        ("Bedrooms", beds),
-        ("Bathrooms", baths),
-        ("Total Rooms", num_rooms),
-        ("Square Feet", sqft),
-        ("Garage Spaces", garage),
-        ("Lot Size", lot_size),
-        ("Year Built", year_built),
-        ("Property Type", prop_type),
-        ("MLS #", mls_id),
-    ]
-
     detail_grid = html.Div([
         html.Div([
             html.Div(label, className="detail-label"),
-            html.Div(value, className="detail-value"),
+            html.Div(fmt(home.get(key)), className="detail-value"),
         ], className="detail-item")
-        for label, value in detail_items
+        for label, key, fmt in _DETAIL_FIELDS
     ], className="detail-grid")
 
     # Build sections
@@ -956,43 +580,86 @@ def create_home_detail_layout(home_id: int) -> html.Div:
     ])
 
 
+# Chart title, y-axis label and AnalysisColumns field for each analysis tab
+_CHART_CONFIGS = {
+    "value": {
+        "title": "Home Value Over Time",
+        "yaxis": "Value ($)",
+        "field": "home_value",
+    },
+    "equity": {
+        "title": "Equity Over Time",
+        "yaxis": "Equity ($)",
+        "field": "equity",
+    },
+    "cash": {
+        "title": "Total Cash Invested Over Time",
+        "yaxis": "Cash Invested ($)",
+        "field": "total_cash_invested",
+    },
+    "costs": {
+        "title": "Annual Cash Outflow Over Time",
+        "yaxis": "Annual Costs ($)",
+        "field": "annual_cash_outflow",
+    },
+    "roi": {
+        "title": "Return on Investment Over Time",
+        "yaxis": "ROI (Equity / Cash Invested)",
+        "field": "roi",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _chart_layout(template: str) -> dict[str, Any]:
+    """Return the analysis chart's shared layout for a Plotly template as plain JSON.
+
+    Resolving the named template and validating a go.Figure cost tens of
+    milliseconds per render, so the layout is built once per theme and the
+    chart callback assembles plain dicts around it.
+    """
+    return go.Layout(
+        template=template,
+        height=500,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode="x unified",
+        autosize=True,
+        yaxis=dict(automargin=False, fixedrange=False),
+        xaxis=dict(title="Year", automargin=False),
+        margin=dict(l=80, r=40, t=60, b=60),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+    ).to_plotly_json()
+
+
+_YEARS_MARKS = {5: "5", 10: "10", 15: "15", 20: "20", 25: "25", 30: "30"}
+
+# Markdown link for a home in the analysis selector; pass the address truncated, then escaped
+_fmt_home_option = "[{} - ${:,.0f}](/home/{})".format
+
+
 def create_cost_analysis_layout() -> html.Div:
     """Create the cost analysis page layout."""
-    homes = get_all_homes()
-
-    # Filter to homes with prices (required for analysis)
-    homes_with_prices = [h for h in homes if h.get("price")]
+    # Only homes with prices can be analysed; the query filters them in SQL
+    homes_with_prices = get_all_homes_minimal()
 
     if not homes_with_prices:
-        return html.Div([
-            create_nav_bar("analysis"),
-            html.Div([
-                html.H3("No homes available for analysis"),
-                html.P("Import some home listings with prices to use the cost analysis feature."),
-            ], className="no-homes-message"),
-        ])
+        return _NO_HOMES_LAYOUT
+
+    # Key on the selector rows so a new or edited home rebuilds the page
+    return _build_cost_analysis_layout(
+        tuple((home["id"], home["address"], home["price"]) for home in homes_with_prices)
+    )
 
-    # Create home checkboxes with clickable links
-    home_checkboxes = []
-    for home in homes_with_prices:
-        price_str = f"${home['price']:,.0f}" if home.get("price") else ""
-        address = home.get('address', 'Unknown')[:40]
-        home_checkboxes.append(
-            html.Div([
-                dcc.Checklist(
-                    id={"type": "home-checkbox", "index": home["id"]},
-                    options=[{"label": "", "value": home["id"]}],
-                    value=[],
-                    style={"display": "inline-block", "verticalAlign": "middle"},
-                ),
-                html.A(
-                    f"{address} - {price_str}",
-                    href=f"/home/{home['id']}",
-                    className="home-link",
-                    style={"marginLeft": "4px", "verticalAlign": "middle"},
-                ),
-            ], className="home-checkbox-item")
-        )
+
+@lru_cache(maxsize=8)
+def _build_cost_analysis_layout(home_options: tuple[tuple[int, str | None, float], ...]) -> html.Div:
+    """Build the cost analysis layout for the selector rows (memoized on them)."""
+    # One selectable row per home; the table virtualizes so only visible rows hit the DOM
+    home_rows = [
+        {"id": home_id, "label": _fmt_home_option(_escape_markdown((address or "Unknown")[:40]), price, home_id)}
+        for home_id, address, price in home_options
+    ]
 
     return html.Div([
         # Navigation
@@ -1004,7 +671,29 @@ def create_cost_analysis_layout() -> html.Div:
                 # Home selection
                 html.Div([
                     html.H4("Select Homes to Compare"),
-                    html.Div(home_checkboxes, className="home-checkbox-list"),
+                    html.Div(
+                        dash_table.DataTable(
+                            id="home-select-table",
+                            data=home_rows,
+                            columns=[{"id": "label", "name": "Home", "presentation": "markdown"}],
+                            row_selectable="multi",
+                            selected_row_ids=[],
+                            virtualization=True,
+                            page_action="none",
+                            fixed_rows={"headers": True},
+                            style_as_list_view=True,
+                            style_table={"maxHeight": "200px", "overflowY": "auto"},
+                            style_header={"display": "none"},
+                            style_cell={
+                                "textAlign": "left",
+                                "fontSize": "0.9rem",
+                                "backgroundColor": "var(--bg-secondary)",
+                                "color": "var(--text-primary)",
+                                "borderBottom": "1px solid var(--border-light)",
+                            },
+                        ),
+                        className="home-checkbox-list",
+                    ),
                 ], className="param-group"),
 
                 # Time horizon slider
@@ -1017,7 +706,9 @@ def create_cost_analysis_layout() -> html.Div:
                             max=30,
                             step=1,
                             value=30,
-                            marks={5: "5", 10: "10", 15: "15", 20: "20", 25: "25", 30: "30"},
+                            marks=_YEARS_MARKS,
+                            # Only the released value reaches the analysis callback
+                            updatemode="mouseup",
                         ),
                         html.Div(id="years-display", className="slider-value"),
                     ], className="slider-container"),
@@ -1031,6 +722,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="down-payment-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["down_payment_pct"] * 100,
                             min=0,
                             max=100,
@@ -1042,6 +734,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="interest-rate-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["interest_rate"] * 100,
                             min=0,
                             max=20,
@@ -1053,6 +746,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="loan-term-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["loan_term_years"],
                             min=5,
                             max=30,
@@ -1064,6 +758,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="purchase-fees-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["purchase_fees"],
                             min=0,
                             step=1000,
@@ -1078,6 +773,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="growth-rate-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["annual_growth_rate"] * 100,
                             min=-10,
                             max=20,
@@ -1089,6 +785,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="repair-pct-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["monthly_repair_pct"] * 100,
                             min=0,
                             max=1,
@@ -1100,6 +797,7 @@ def create_cost_analysis_layout() -> html.Div:
                         dcc.Input(
                             id="maint-inflation-input",
                             type="number",
+                            debounce=0.5,
                             value=DEFAULTS["maintenance_inflation"] * 100,
                             min=0,
                             max=10,
@@ -1124,6 +822,9 @@ def create_cost_analysis_layout() -> html.Div:
                 # Store for active tab
                 dcc.Store(id="active-chart-tab", data="value"),
 
+                # Analysis results, recomputed only when inputs or selections change
+                dcc.Store(id="analysis-results-store"),
+
                 # Summary cards
                 html.Div(id="summary-cards", className="summary-cards"),
 
@@ -1142,7 +843,50 @@ def create_cost_analysis_layout() -> html.Div:
     ])
 
 
-def generate_data_table(active_tab: str, all_results: dict[str, Any], years: int) -> html.Div | list[Any]:
+def _load_analysis_results(analysis: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Rebuild the per-home results mapping from analysis-results-store data.
+
+    Args:
+        analysis: Store data written by the compute_analysis callback
+
+    Returns:
+        Dictionary of {"results", "color", "home"} entries keyed by home label
+    """
+    return {
+        entry["label"]: {
+            "results": AnalysisColumns.from_dict(entry["results"]),
+            "color": entry["color"],
+            "home": entry["home"],
+        }
+        for entry in analysis["homes"]
+    }
+
+
+# (column name, AnalysisColumns field, is currency) for each analysis tab's table
+_TABLE_FIELDS = {
+    "value": (("Home Value", "home_value", True),),
+    "equity": (("Equity", "equity", True), ("Loan Balance", "loan_balance", True)),
+    "cash": (("Total Cash Invested", "total_cash_invested", True),),
+    "costs": (
+        ("Property Taxes", "annual_taxes", True),
+        ("Repairs", "annual_repair", True),
+        ("Maintenance", "annual_maintenance", True),
+        ("Mortgage", "annual_mortgage_payment", True),
+        ("Total Outflow", "annual_cash_outflow", True),
+    ),
+    "roi": (("ROI", "roi", False), ("Equity", "equity", True), ("Cash Invested", "total_cash_invested", True)),
+}
+
+_TABLE_TITLES = {
+    "value": "Home Value Comparison",
+    "equity": "Equity Comparison",
+    "cash": "Cash Invested Comparison",
+    "costs": "Annual Costs Comparison",
+    "roi": "ROI Comparison",
+}
+
+
+def generate_data_table(active_tab: str, all_results: dict[str, Any]) -> html.Div | list[Any]:
     """Generate a unified comparison table for the analysis results.
 
     All selected homes are shown in a single table for easy comparison.
@@ -1151,128 +895,241 @@ def generate_data_table(active_tab: str, all_results: dict[str, Any], years: int
     Args:
         active_tab: The currently active chart tab (value, equity, cash, costs, roi)
         all_results: Dictionary of analysis results keyed by home label
-        years: Number of years in the analysis
 
     Returns:
-        HTML table element showing the data
+        Div holding a title and a DataTable of the data
     """
     if not all_results:
         return []
 
-    home_labels = list(all_results.keys())
-    num_homes = len(home_labels)
-    first_results = list(all_results.values())[0]["results"]
-    all_years = [r.year for r in first_results]
-
-    # Define which fields to show based on the active tab
-    tab_config = {
-        "value": [("Home Value", "home_value", True)],
-        "equity": [("Equity", "equity", True), ("Loan Balance", "loan_balance", True)],
-        "cash": [("Total Cash Invested", "total_cash_invested", True)],
-        "costs": [
-            ("Property Taxes", "annual_taxes", True),
-            ("Repairs", "annual_repair", True),
-            ("Maintenance", "annual_maintenance", True),
-            ("Mortgage", "annual_mortgage_payment", True),
-            ("Total Outflow", "annual_cash_outflow", True),
-        ],
-        "roi": [("ROI", "roi", False), ("Equity", "equity", True), ("Cash Invested", "total_cash_invested", True)],
-    }
-
-    fields = tab_config.get(active_tab, tab_config["value"])
-
-    # Build header rows
-    # Row 1: Year + metric names (spanning all homes)
-    header_row1_cells = [html.Th("Year", rowSpan=2)]
-    for field_name, _, _ in fields:
-        header_row1_cells.append(
-            html.Th(field_name, colSpan=num_homes, style={"textAlign": "center"})
-        )
+    # Bind each home's label, color and results once for the column loop below
+    per_home = [(label, data["color"], data["results"]) for label, data in all_results.items()]
+    all_years = per_home[0][2].year.astype(int).tolist()
+
+    fields = _TABLE_FIELDS.get(active_tab, _TABLE_FIELDS["value"])
+
+    # One DataTable column per (metric, home); the two-row header merges each
+    # metric across its homes, and every cell carries its pre-formatted text
+    table_columns = [{"id": "year", "name": ["", "Year"]}]
+    header_tooltips = {}
+    header_styles = [{"if": {"header_index": 1}, "fontSize": "0.8rem", "fontWeight": "normal"}]
+    data_styles = [{"if": {"row_index": "odd"}, "backgroundColor": "var(--bg-alt)"}]
+    rows = [{"year": year} for year in all_years]
+    totals = {"year": "Total"}
+
+    for field_index, (field_name, field_key, is_currency) in enumerate(fields):
+        for home_index, (label, color, results) in enumerate(per_home):
+            column_id = f"{field_index}-{home_index}"
+            table_columns.append({"id": column_id, "name": [field_name, label[:20]]})
+            header_tooltips[column_id] = ["", label]
+            header_styles.append({"if": {"column_id": column_id, "header_index": 1}, "color": color})
+            data_styles.append({"if": {"column_id": column_id}, "color": color})
+
+            # Format each home's column from its result array in a single pass
+            values = getattr(results, field_key)
+            if field_key == "roi":
+                # ROI is NaN where nothing has been invested yet
+                texts = [_fmt_roi(val) if val == val and val else "—" for val in values.tolist()]
+            elif is_currency:
+                texts = list(map(_fmt_usd, values.tolist()))
+            else:
+                texts = list(map(_fmt_decimal, values.tolist()))
+            for row, text in zip(rows, texts):
+                row[column_id] = text
 
-    # Row 2: Home names under each metric (color-coded)
-    header_row2_cells = []
-    for _ in fields:
-        for label in home_labels:
-            color = all_results[label]["color"]
-            header_row2_cells.append(
-                html.Th(
-                    label[:20],
-                    style={"color": color, "fontSize": "0.8rem", "fontWeight": "normal"},
-                    title=label,
-                )
-            )
+            if active_tab == "costs":
+                # Sum all years (skip year 0 for annual costs)
+                totals[column_id] = _fmt_usd(values[1:].sum())
 
-    # Build data rows - one row per year
-    data_rows = []
-    for year_idx, year in enumerate(all_years):
-        cells = [html.Td(str(year))]
-
-        for field_name, field_key, is_currency in fields:
-            for label in home_labels:
-                data = all_results[label]
-                results = data["results"]
-                color = data["color"]
-                r = results[year_idx]
-
-                if field_key == "roi":
-                    val = r.roi
-                    cell_text = f"{val:.2f}x" if val else "—"
-                else:
-                    val = getattr(r, field_key)
-                    cell_text = f"${val:,.0f}" if is_currency else f"{val:,.2f}"
-
-                cells.append(
-                    html.Td(
-                        cell_text,
-                        style={"color": color},
-                        title=f"{label}: {cell_text}",
-                    )
-                )
-
-        data_rows.append(html.Tr(cells))
-
-    # Build totals row for costs tab
-    footer_rows = []
+    # Totals row for the costs tab
     if active_tab == "costs":
-        total_cells = [html.Td("Total", style={"fontWeight": "600"})]
-        for field_name, field_key, is_currency in fields:
-            for label in home_labels:
-                data = all_results[label]
-                results = data["results"]
-                color = data["color"]
-                # Sum all years (skip year 0 for annual costs)
-                total = sum(getattr(r, field_key) for r in results[1:])
-                cell_text = f"${total:,.0f}" if is_currency else f"{total:,.2f}"
-                total_cells.append(
-                    html.Td(
-                        cell_text,
-                        style={"color": color, "fontWeight": "600"},
-                        title=f"{label} Total: {cell_text}",
-                    )
-                )
-        footer_rows.append(html.Tr(total_cells))
-
-    title_map = {
-        "value": "Home Value Comparison",
-        "equity": "Equity Comparison",
-        "cash": "Cash Invested Comparison",
-        "costs": "Annual Costs Comparison",
-        "roi": "ROI Comparison",
-    }
+        rows.append(totals)
+        data_styles.append({
+            "if": {"row_index": len(rows) - 1},
+            "fontWeight": "600",
+            "backgroundColor": "var(--table-footer-bg)",
+            "borderTop": "2px solid var(--table-footer-border)",
+        })
 
     return html.Div([
-        html.H3(title_map.get(active_tab, "Comparison")),
-        html.Table([
-            html.Thead([
-                html.Tr(header_row1_cells),
-                html.Tr(header_row2_cells),
-            ]),
-            html.Tbody(data_rows),
-            html.Tfoot(footer_rows) if footer_rows else None,
-        ], className="data-table"),
+        html.H3(_TABLE_TITLES.get(active_tab, "Comparison")),
+        dash_table.DataTable(
+            columns=table_columns,
+            data=rows,
+            merge_duplicate_headers=True,
+            fixed_columns={"headers": True, "data": 1},
+            tooltip_header=header_tooltips,
+            page_action="none",
+            style_table={"minWidth": "100%", "overflowX": "auto"},
+            style_header={
+                "backgroundColor": "var(--bg-tertiary)",
+                "color": "var(--text-primary)",
+                "fontWeight": "600",
+                "textAlign": "center",
+            },
+            style_header_conditional=header_styles,
+            style_cell={
+                "textAlign": "right",
+                "padding": "8px 12px",
+                "fontSize": "0.85rem",
+                "whiteSpace": "nowrap",
+                "backgroundColor": "var(--bg-secondary)",
+                "color": "var(--text-primary)",
+                "border": "1px solid var(--border-secondary)",
+            },
+            style_cell_conditional=[
+                {"if": {"column_id": "year"}, "textAlign": "left", "backgroundColor": "var(--bg-tertiary)"},
+            ],
+            style_data_conditional=data_styles,
+        ),
     ])
 
 
+# Marker popup markup, filled per home with already-escaped values
+_fmt_popup = (
+    '<div class="popup-content">{image}'
+    '<div class="popup-price">{price}</div>'
+    '<div class="popup-address"><a href="/home/{id}" class="home-link">{address}</a></div>'
+    '<div class="popup-details">{beds} bed | {baths} bath | {sqft} sqft{garage}<br>'
+    "{property_type}{mls}</div></div>"
+).format
+
+
+# (homes digest, FeatureCollection) of the last marker build
+_GEOJSON_CACHE: tuple[str, dict[str, Any]] | None = None
+
+
+def _homes_geojson() -> tuple[dict[str, Any], str]:
+    """Return the map's marker FeatureCollection and the homes digest it was built from.
+
+    Memoized on the homes digest, so the popups are rendered once per change
+    rather than once per request.
+    """
+    global _GEOJSON_CACHE
+    homes, version = _cached_homes()
+    cached = _GEOJSON_CACHE
+    if cached is None or cached[0] != version:
+        cached = _GEOJSON_CACHE = (version, _build_homes_geojson(homes))
+    return cached[1], version
+
+
+def _build_homes_geojson(homes: list[HomeRecord]) -> dict[str, Any]:
+    """Build the map's marker FeatureCollection from a list of homes."""
+    features = []
+    for home in homes:
+        if home.latitude and home.longitude:
+            # Create popup content
+            price_str = _fmt_usd(home.price) if home.price else "Price N/A"
+            beds = home.bedrooms or "?"
+            baths = home.bathrooms or "?"
+            sqft = _fmt_thousands(home.sqft) if home.sqft else "?"
+            garage = home.garage_spaces or 0
+            mls_id = home.mls_id or ""
+
+            # Leaflet renders GeoJSON popups from an HTML string, so escape the
+            # scraped values and keep the markup compact (styling is in app.css)
+            image_html = ""
+            if home.image_url:
+                image_html = f'<img src="{escape(home.image_url)}" class="popup-img" onerror="this.remove()">'
+
+            mls_html = f"<br>MLS: {escape(mls_id)}" if mls_id else ""
+            garage_str = f" | {garage} garage" if garage else ""
+
+            popup_html = _fmt_popup(
+                image=image_html,
+                price=price_str,
+                id=home.id,
+                address=escape(home.address or "Address N/A"),
+                beds=beds,
+                baths=baths,
+                sqft=sqft,
+                garage=garage_str,
+                property_type=escape(home.property_type or ""),
+                mls=mls_html,
+            )
+
+            # dl.GeoJSON binds the "popup" and "tooltip" properties to each point;
+            # five decimals (~1 m) is all a marker needs from the geocoded position
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [round(home.longitude, 5), round(home.latitude, 5)]},
+                "properties": {
+                    "id": home.id,
+                    "tooltip": escape(home.address or "Unknown"),
+                    "popup": popup_html,
+                },
+            })
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+# Lifetime of one /events stream; the browser reconnects when it ends
+_EVENTS_STREAM_SECONDS = 300
+
+
+def register_routes(app: dash.Dash) -> None:
+    """Register plain Flask routes on the Dash server."""
+
+    @app.server.route("/api/homes")
+    def api_homes() -> flask.Response:
+        """Serve all homes as JSON, revalidated by ETag."""
+        homes, version = _cached_homes()
+        response = flask.jsonify(homes)
+        response.set_etag(version)
+        response.headers["Cache-Control"] = "public, max-age=30"
+        return response.make_conditional(flask.request)
+
+    @app.server.route("/api/homes.geojson")
+    def api_homes_geojson() -> flask.Response:
+        """Serve the map markers as GeoJSON, revalidated by ETag."""
+        geojson, version = _homes_geojson()
+        response = flask.jsonify(geojson)
+        response.set_etag(version)
+        response.headers["Cache-Control"] = "public, max-age=30"
+        return response.make_conditional(flask.request)
+
+    @app.server.route("/events")
+    def homes_events() -> flask.Response:
+        """Push a homes-updated server-sent event whenever a home is added.
+
+        Writes made by the serving process wake the stream immediately. Writes
+        from any other process are picked up from the database file's mtime
+        within a few seconds. That covers a CLI import, and also the import
+        watcher when app.run(debug=True)'s reloader serves requests from a
+        child process. Each stream closes after _EVENTS_STREAM_SECONDS so an
+        open tab never pins a server thread for good. The browser reconnects
+        after the retry delay with Last-Event-ID, and a change made in the gap
+        is reported as soon as the new stream opens.
+        """
+        last_event_id = flask.request.headers.get("Last-Event-ID")
+
+        def stream():
+            version, mtime = get_homes_version(), get_db_mtime()
+            event_id = f"{version}-{mtime}"
+            # Flush headers right away, tell the browser how soon to reconnect
+            # and record where this stream starts for the next Last-Event-ID
+            yield f"retry: 5000\nid: {event_id}\n\n"
+            if last_event_id and last_event_id != event_id:
+                yield f"event: homes-updated\ndata: {event_id}\n\n"
+            deadline = time.monotonic() + _EVENTS_STREAM_SECONDS
+            while time.monotonic() < deadline:
+                latest = wait_for_homes_change(version, timeout=5)
+                latest_mtime = get_db_mtime()
+                if latest == version and latest_mtime == mtime:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                version, mtime = latest, latest_mtime
+                event_id = f"{version}-{mtime}"
+                yield f"event: homes-updated\nid: {event_id}\ndata: {event_id}\n\n"
+
+        return flask.Response(
+            stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
 def register_callbacks(app: dash.Dash) -> None:
     """Register all Dash callbacks."""
 
@@ -1312,6 +1169,45 @@ def register_callbacks(app: dash.Dash) -> None:
         prevent_initial_call=True,
     )
 
+    # Clientside callback that subscribes once to the server's homes-updated events.
+    # Hidden tabs drop the stream so they hold no server connection, and catch up
+    # with one digest check when shown again.
+    app.clientside_callback(
+        """
+        function(pathname) {
+            if (window.homesEvents || !window.EventSource) {
+                return dash_clientside.no_update;
+            }
+            window.homesEvents = {source: null};
+            function connect() {
+                var source = new EventSource('/events');
+                source.addEventListener('homes-updated', function(e) {
+                    dash_clientside.set_props('homes-events', {data: e.data});
+                });
+                window.homesEvents.source = source;
+            }
+            document.addEventListener('visibilitychange', function() {
+                var source = window.homesEvents.source;
+                if (document.hidden) {
+                    if (source) {
+                        source.close();
+                        window.homesEvents.source = null;
+                    }
+                } else if (!source) {
+                    connect();
+                    dash_clientside.set_props('homes-events', {data: 'visible-' + Date.now()});
+                }
+            });
+            if (!document.hidden) {
+                connect();
+            }
+            return dash_clientside.no_update;
+        }
+        """,
+        Output("homes-events", "data"),
+        Input("url", "pathname"),
+    )
+
     @app.callback(
         Output("page-content", "children"),
         Input("url", "pathname"),
@@ -1330,207 +1226,105 @@ def register_callbacks(app: dash.Dash) -> None:
 
     @app.callback(
         Output("homes-data", "data"),
-        Input("auto-refresh", "n_intervals"),
+        Input("homes-events", "data"),
+        State("homes-data", "data"),
+        prevent_initial_call=True,
     )
-    def refresh_data(n_intervals: int) -> list[dict[str, Any]]:
-        """Refresh home data from the database."""
-        return get_all_homes()
+    def refresh_data(event_version: str | None, current: dict[str, str] | None) -> dict[str, str]:
+        """Refresh home data from the database when the server reports a change."""
+        return _homes_data_update(current)
 
     @app.callback(
         Output("homes-data", "data", allow_duplicate=True),
         Input("refresh-button", "n_clicks"),
+        State("homes-data", "data"),
         prevent_initial_call=True,
     )
-    def refresh_data_button(n_clicks: int | None) -> list[dict[str, Any]]:
+    def refresh_data_button(n_clicks: int | None, current: dict[str, str] | None) -> dict[str, str]:
         """Refresh home data when button is clicked."""
-        return get_all_homes()
+        # Force a re-query, which also picks up writes that left the mtime unchanged
+        _invalidate_homes_cache()
+        return _homes_data_update(current)
 
     @app.callback(
-        Output("homes-list", "children"),
+        Output("homes-list", "data"),
+        Output("homes-list", "page_count"),
+        Output("homes-list-empty", "style"),
         Input("homes-data", "data"),
+        Input("homes-list", "page_current"),
+        Input("homes-list", "page_size"),
+        Input("homes-list", "sort_by"),
+        Input("homes-list", "filter_query"),
     )
-    def update_homes_list(homes_data: list[dict[str, Any]] | None) -> html.Table | html.P:
-        """Update the homes list with clickable entries."""
-        if not homes_data:
-            return html.P("No homes in database. Drop HTML files into the import/ directory to add homes.")
-
-        # Create table with clickable rows
-        header = html.Tr([
-            html.Th("Address"),
-            html.Th("City"),
-            html.Th("State/Prov"),
-            html.Th("Price"),
-            html.Th("Beds"),
-            html.Th("Baths"),
-            html.Th("Sq Ft"),
-            html.Th("Rooms"),
-            html.Th("Garage"),
-            html.Th("Year Built"),
-            html.Th("Type"),
-            html.Th("MLS #"),
-        ])
-
-        rows = []
-        for home in homes_data:
-            price_str = f"${home['price']:,.0f}" if home.get("price") else "—"
-            sqft_str = f"{home['sqft']:,}" if home.get("sqft") else "—"
-
-            row = html.Tr([
-                html.Td(html.A(
-                    home.get("address") or "—",
-                    href=f"/home/{home['id']}",
-                    className="home-link",
-                )),
-                html.Td(home.get("city") or "—"),
-                html.Td(home.get("state") or "—"),
-                html.Td(price_str),
-                html.Td(home.get("bedrooms") or "—"),
-                html.Td(home.get("bathrooms") or "—"),
-                html.Td(sqft_str),
-                html.Td(home.get("num_rooms") or "—"),
-                html.Td(home.get("garage_spaces") or "—"),
-                html.Td(home.get("year_built") or "—"),
-                html.Td(home.get("property_type") or "—"),
-                html.Td(home.get("mls_id") or "—"),
-            ])
-            rows.append(row)
-
-        return html.Table(
-            [html.Thead(header), html.Tbody(rows)],
-            style={
-                "width": "100%",
-                "borderCollapse": "collapse",
-                "fontSize": "0.95rem",
-            },
+    def update_homes_list(
+        homes_version: dict[str, str] | None,
+        page_current: int | None,
+        page_size: int | None,
+        sort_by: list[dict[str, str]] | None,
+        filter_query: str | None,
+    ) -> tuple[list[dict[str, Any]], int, dict[str, str]]:
+        """Fetch the visible page of the homes table from the database."""
+        page_size = page_size or 50
+        sort = sort_by[0] if sort_by else {}
+        filters = _parse_filter_query(filter_query)
+        homes, total = get_homes_page(
+            offset=(page_current or 0) * page_size,
+            limit=page_size,
+            sort_by=sort.get("column_id"),
+            descending=sort.get("direction") == "desc",
+            filters=filters,
         )
+        for home in homes:
+            home["address"] = f"[{_escape_markdown(home['address'] or '—')}](/home/{home['id']})"
+        # Only an unfiltered empty result means there is nothing imported yet
+        empty_style = {} if total == 0 and not filters else {"display": "none"}
+        return homes, max(1, -(-total // page_size)), empty_style
 
     @app.callback(
-        Output("marker-layer", "children"),
-        Input("homes-data", "data"),
-    )
-    def update_map_markers(homes_data: list[dict[str, Any]] | None) -> list[dl.Marker]:
-        """Update map markers based on home data."""
-        if not homes_data:
-            return []
-
-        markers = []
-        for home in homes_data:
-            if home.get("latitude") and home.get("longitude"):
-                # Create popup content
-                price_str = f"${home['price']:,.0f}" if home.get("price") else "Price N/A"
-                beds = home.get("bedrooms") or "?"
-                baths = home.get("bathrooms") or "?"
-                sqft = f"{home['sqft']:,}" if home.get("sqft") else "?"
-                garage = home.get("garage_spaces") or 0
-                mls_id = home.get("mls_id") or ""
-
-                # Build image HTML if available
-                image_html = ""
-                if home.get("image_url"):
-                    image_html = f'<img src="{home["image_url"]}" style="width:100%;max-height:120px;object-fit:cover;border-radius:4px;margin-bottom:8px;" onerror="this.style.display=\'none\'"/>'
-
-                # Build MLS line if available
-                mls_html = f"<br/>MLS: {mls_id}" if mls_id else ""
-
-                popup_html = f"""
-                <div class="popup-content">
-                    {image_html}
-                    <div class="popup-price">{price_str}</div>
-                    <div class="popup-address">
-                        <a href="/home/{home['id']}" class="home-link">{home.get('address', 'Address N/A')}</a>
-                    </div>
-                    <div class="popup-details">
-                        {beds} bed | {baths} bath | {sqft} sqft{f' | {garage} garage' if garage else ''}<br/>
-                        {home.get('property_type', '')}{mls_html}
-                    </div>
-                </div>
-                """
-
-                marker = dl.Marker(
-                    position=[home["latitude"], home["longitude"]],
-                    children=[
-                        dl.Tooltip(home.get("address", "Unknown")),
-                        dl.Popup(html.Div(dash.dcc.Markdown(popup_html, dangerously_allow_html=True))),
-                    ],
-                )
-                markers.append(marker)
-
-        return markers
-
-    @app.callback(
+        Output("marker-layer", "url"),
         Output("home-count", "children"),
-        Input("homes-data", "data"),
-    )
-    def update_home_count(homes_data: list[dict[str, Any]] | None) -> str:
-        """Update the home count display."""
-        count = len(homes_data) if homes_data else 0
-        return f"{count} home{'s' if count != 1 else ''} in database"
-
-    @app.callback(
         Output("home-map", "viewport"),
         Input("homes-data", "data"),
     )
-    def update_map_view(homes_data: list[dict[str, Any]] | None) -> dict[str, Any]:
-        """Update map viewport based on home locations.
+    def update_map_and_count(homes_version: dict[str, str] | None) -> tuple[str, str, dict[str, Any]]:
+        """Refresh the map markers, map viewport and home count in one request.
 
-        Note: We use the 'viewport' property instead of 'center'/'zoom' because
-        dash-leaflet's center and zoom props are immutable after initial render.
-        The viewport property allows dynamic updates after the map is mounted.
+        The browser fetches and caches the markers from /api/homes.geojson; the
+        version query changes only when a home does.
         """
-        if not homes_data:
-            return dict(center=[39.8283, -98.5795], zoom=4, transition="flyTo")
-
-        # Get homes with coordinates
-        homes_with_coords = [
-            h for h in homes_data if h.get("latitude") and h.get("longitude")
-        ]
-
-        if not homes_with_coords:
-            return dict(center=[39.8283, -98.5795], zoom=4, transition="flyTo")
-
-        # Calculate center
-        lats = [h["latitude"] for h in homes_with_coords]
-        lngs = [h["longitude"] for h in homes_with_coords]
-
-        center_lat = sum(lats) / len(lats)
-        center_lng = sum(lngs) / len(lngs)
-
-        # Calculate appropriate zoom level based on spread
-        lat_spread = max(lats) - min(lats) if len(lats) > 1 else 0
-        lng_spread = max(lngs) - min(lngs) if len(lngs) > 1 else 0
-        spread = max(lat_spread, lng_spread)
-
-        if spread < 0.01:
-            zoom = 15
-        elif spread < 0.05:
-            zoom = 13
-        elif spread < 0.1:
-            zoom = 12
-        elif spread < 0.5:
-            zoom = 10
-        elif spread < 1:
-            zoom = 9
-        elif spread < 5:
-            zoom = 7
-        else:
-            zoom = 5
-
-        return dict(center=[center_lat, center_lng], zoom=zoom, transition="flyTo")
+        homes_data, version = _cached_homes()
+        count = len(homes_data)
+        return (
+            f"/api/homes.geojson?v={version}",
+            f"{count} home{'s' if count != 1 else ''} in database",
+            _map_viewport(homes_data),
+        )
 
     # Cost Analysis Page Callbacks
 
-    @app.callback(
+    # Clientside callback for the years display, which follows the slider while dragging
+    app.clientside_callback(
+        """
+        function(years) {
+            return (years == null ? 30 : years) + ' years';
+        }
+        """,
         Output("years-display", "children"),
-        Input("years-slider", "value"),
-        prevent_initial_call=False,
+        Input("years-slider", "drag_value"),
     )
-    def update_years_display(years: int | None) -> str:
-        """Update the years display text."""
-        if years is None:
-            return "30 years"
-        return f"{years} years"
 
-    @app.callback(
+    # Tab switching only maps button IDs to class names, so it stays in the browser
+    app.clientside_callback(
+        """
+        function() {
+            const triggered = dash_clientside.callback_context.triggered;
+            if (!triggered.length) {
+                return dash_clientside.no_update;
+            }
+            // Button IDs are "tab-<name>"
+            return triggered[0].prop_id.split('.')[0].slice(4);
+        }
+        """,
         Output("active-chart-tab", "data"),
         [
             Input("tab-value", "n_clicks"),
@@ -1541,28 +1335,15 @@ def register_callbacks(app: dash.Dash) -> None:
         ],
         prevent_initial_call=True,
     )
-    def update_active_tab(
-        value_clicks: int,
-        equity_clicks: int,
-        cash_clicks: int,
-        costs_clicks: int,
-        roi_clicks: int,
-    ) -> str:
-        """Update the active chart tab based on button clicks."""
-        ctx = dash.callback_context
-        if not ctx.triggered:
-            return "value"
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        tab_map = {
-            "tab-value": "value",
-            "tab-equity": "equity",
-            "tab-cash": "cash",
-            "tab-costs": "costs",
-            "tab-roi": "roi",
-        }
-        return tab_map.get(button_id, "value")
 
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(activeTab) {
+            return ['value', 'equity', 'cash', 'costs', 'roi'].map(
+                tab => tab === activeTab ? 'chart-tab active' : 'chart-tab'
+            );
+        }
+        """,
         [
             Output("tab-value", "className"),
             Output("tab-equity", "className"),
@@ -1572,22 +1353,10 @@ def register_callbacks(app: dash.Dash) -> None:
         ],
         Input("active-chart-tab", "data"),
     )
-    def update_tab_styles(active_tab: str) -> list[str]:
-        """Update tab button styles based on active tab."""
-        tabs = ["value", "equity", "cash", "costs", "roi"]
-        return [
-            "chart-tab active" if tab == active_tab else "chart-tab"
-            for tab in tabs
-        ]
 
     @app.callback(
+        Output("analysis-results-store", "data"),
         [
-            Output("analysis-chart", "figure"),
-            Output("summary-cards", "children"),
-            Output("analysis-data-table", "children"),
-        ],
-        [
-            Input("active-chart-tab", "data"),
             Input("years-slider", "value"),
             Input("down-payment-input", "value"),
             Input("interest-rate-input", "value"),
@@ -1596,13 +1365,12 @@ def register_callbacks(app: dash.Dash) -> None:
             Input("growth-rate-input", "value"),
             Input("repair-pct-input", "value"),
             Input("maint-inflation-input", "value"),
-            Input({"type": "home-checkbox", "index": ALL}, "value"),
-            Input("theme-store", "data"),
+            Input("home-select-table", "selected_row_ids"),
         ],
+        State("analysis-results-store", "data"),
         prevent_initial_call=False,
     )
-    def update_analysis_chart(
-        active_tab: str,
+    def compute_analysis(
         years: int | None,
         down_payment_pct: float | None,
         interest_rate: float | None,
@@ -1611,50 +1379,44 @@ def register_callbacks(app: dash.Dash) -> None:
         growth_rate: float | None,
         repair_pct: float | None,
         maint_inflation: float | None,
-        home_selections: list[list[int]],
-        current_theme: str | None,
-    ) -> tuple[go.Figure, list[html.Div] | html.Div, html.Div | list[Any]]:
-        """Update the analysis chart, summary cards, and data table based on selections."""
-        # Determine chart template based on theme
-        chart_template = "plotly_dark" if current_theme == "dark" else "plotly_white"
-        paper_bgcolor = "rgba(0,0,0,0)" if current_theme == "dark" else "rgba(0,0,0,0)"
-        plot_bgcolor = "rgba(0,0,0,0)" if current_theme == "dark" else "rgba(0,0,0,0)"
-
-        # Get selected home IDs from the checkbox values
-        selected_ids = []
-        if home_selections:
-            for selection in home_selections:
-                if selection:
-                    selected_ids.extend(selection)
-
-        # Create empty figure if no homes selected
+        selected_ids: list[int] | None,
+        previous: dict[str, Any] | None,
+    ) -> dict[str, Any] | None:
+        """Run the cost analysis for the selected homes and store the results.
+
+        The active chart tab and theme are not inputs, so switching tabs only
+        re-renders from the stored results. The raw inputs are stored alongside
+        the results with the homes digest, and a trigger that leaves both
+        unchanged (e.g. re-selecting the same homes) skips the database reads
+        and the re-render. The store also flags whether the chart's traces
+        survive, so the chart can patch.
+        """
         if not selected_ids:
-            fig = go.Figure()
-            fig.update_layout(
-                title="Select homes to compare",
-                xaxis_title="Year",
-                yaxis_title="Value ($)",
-                template=chart_template,
-                height=500,
-                paper_bgcolor=paper_bgcolor,
-                plot_bgcolor=plot_bgcolor,
-            )
-            return fig, html.Div("Select one or more homes to see analysis", className="no-homes-message"), []
+            if previous is None:
+                raise PreventUpdate
+            return None
+
+        inputs = [
+            years, down_payment_pct, interest_rate, loan_term, purchase_fees,
+            growth_rate, repair_pct, maint_inflation, list(selected_ids),
+            _cached_homes_version(),
+        ]
+        if previous is not None and previous.get("inputs") == inputs:
+            raise PreventUpdate
+
+        # Convert inputs to proper values (handle None)
+        years = years or 30
 
-        # Get home data
-        homes_data = []
-        for home_id in selected_ids:
-            home = get_home_by_id(home_id)
-            if home and home.get("price"):
-                homes_data.append(home)
+        # Get home data in one query, keeping the selection order
+        homes_by_id = get_homes_by_ids(selected_ids)
+        homes_data = [
+            homes_by_id[home_id] for home_id in selected_ids
+            if home_id in homes_by_id and homes_by_id[home_id].get("price")
+        ]
 
         if not homes_data:
-            fig = go.Figure()
-            fig.update_layout(title="No valid homes selected", template=chart_template)
-            return fig, [], []
+            return {"inputs": inputs, "years": years, "homes": []}
 
-        # Convert inputs to proper values (handle None)
-        years = years or 30
         down_pct = (down_payment_pct or 20) / 100
         int_rate = (interest_rate or 4.79) / 100
         loan_yrs = loan_term or 30
@@ -1663,11 +1425,9 @@ def register_callbacks(app: dash.Dash) -> None:
         repair = (repair_pct or 0.03) / 100
         maint_inf = (maint_inflation or 2) / 100
 
-        # Run analysis for each home
-        all_results = {}
-        colors = ["#667eea", "#f093fb", "#f5576c", "#4facfe", "#43e97b", "#fa709a"]
-
-        for i, home in enumerate(homes_data):
+        # Build analysis params for each home
+        homes_params = []
+        for home in homes_data:
             # Use home-specific values if available, otherwise use global params
             home_tax_rate = home.get("property_tax_rate")
             # If tax rate looks like a dollar amount (> 1), convert to rate
@@ -1689,101 +1449,143 @@ def register_callbacks(app: dash.Dash) -> None:
                 loan_term_years=loan_yrs,
                 maintenance_inflation=maint_inf,
             )
+            homes_params.append((str(home["id"]), params))
 
-            results = run_analysis(params, years)
-            label = f"{home.get('address', 'Unknown')[:30]}"
-            all_results[label] = {
-                "results": results,
+        # Analyze all selected homes together as one batch
+        results = compare_homes(homes_params, years)
+        colors = ["#667eea", "#f093fb", "#f5576c", "#4facfe", "#43e97b", "#fa709a"]
+
+        stored_homes = [
+            {
+                "label": f"{home.get('address', 'Unknown')[:30]}",
                 "color": colors[i % len(colors)],
-                "home": home,
+                "home": {"id": home["id"], "price": home["price"]},
+                "results": results[str(home["id"])].to_dict(),
             }
+            for i, home in enumerate(homes_data)
+        ]
 
-        # Create figure based on active tab
-        fig = go.Figure()
+        # Same homes over the same years keep the chart's traces, so the chart
+        # callback can patch their values instead of resending the figure
+        traces_unchanged = (
+            previous is not None
+            and previous.get("years") == years
+            and [h["label"] for h in previous.get("homes", [])] == [h["label"] for h in stored_homes]
+        )
 
-        chart_configs = {
-            "value": {
-                "title": "Home Value Over Time",
-                "yaxis": "Value ($)",
-                "field": "home_value",
-            },
-            "equity": {
-                "title": "Equity Over Time",
-                "yaxis": "Equity ($)",
-                "field": "equity",
-            },
-            "cash": {
-                "title": "Total Cash Invested Over Time",
-                "yaxis": "Cash Invested ($)",
-                "field": "total_cash_invested",
-            },
-            "costs": {
-                "title": "Annual Cash Outflow Over Time",
-                "yaxis": "Annual Costs ($)",
-                "field": "annual_cash_outflow",
-            },
-            "roi": {
-                "title": "Return on Investment Over Time",
-                "yaxis": "ROI (Equity / Cash Invested)",
-                "field": "roi",
-            },
-        }
+        return {"inputs": inputs, "years": years, "homes": stored_homes, "traces_unchanged": traces_unchanged}
 
-        config = chart_configs.get(active_tab, chart_configs["value"])
+    @app.callback(
+        Output("analysis-chart", "figure"),
+        [
+            Input("analysis-results-store", "data"),
+            Input("active-chart-tab", "data"),
+            Input("theme-store", "data"),
+        ],
+    )
+    def update_analysis_chart(
+        analysis: dict[str, Any] | None,
+        active_tab: str,
+        current_theme: str | None,
+    ) -> dict[str, Any] | dash.Patch:
+        """Draw the analysis chart for the active tab from the stored results."""
+        layout = _chart_layout("plotly_dark" if current_theme == "dark" else "plotly_white")
+
+        # Create empty figure if no homes selected
+        if analysis is None:
+            return {
+                "data": [],
+                "layout": {
+                    **layout,
+                    "title": {"text": "Select homes to compare"},
+                    "yaxis": {**layout["yaxis"], "title": {"text": "Value ($)"}},
+                },
+            }
 
+        all_results = _load_analysis_results(analysis)
+
+        if not all_results:
+            return {"data": [], "layout": {**layout, "title": {"text": "No valid homes selected"}}}
+
+        config = _CHART_CONFIGS.get(active_tab, _CHART_CONFIGS["value"])
+
+        # Hand the result columns to Plotly as arrays; ROI is NaN before any cash is in
+        series = []
         for label, data in all_results.items():
             results = data["results"]
-            color = data["color"]
-
-            x_values = [r.year for r in results]
             if config["field"] == "roi":
-                y_values = [r.roi if r.roi else 0 for r in results]
+                y_values = np.nan_to_num(results.roi)
+                hovertemplate = f"{label}<br>Year %{{x}}<br>ROI: %{{y:.2f}}x<extra></extra>"
             else:
-                y_values = [getattr(r, config["field"]) for r in results]
-
-            fig.add_trace(
-                go.Scatter(
-                    x=x_values,
-                    y=y_values,
-                    mode="lines",
-                    name=label,
-                    line=dict(color=color, width=2),
-                    hovertemplate=f"{label}<br>Year %{{x}}<br>{config['yaxis']}: %{{y:,.0f}}<extra></extra>"
-                    if config["field"] != "roi"
-                    else f"{label}<br>Year %{{x}}<br>ROI: %{{y:.2f}}x<extra></extra>",
-                )
-            )
+                y_values = getattr(results, config["field"])
+                hovertemplate = f"{label}<br>Year %{{x}}<br>{config['yaxis']}: %{{y:,.0f}}<extra></extra>"
+            series.append((label, data, y_values, hovertemplate))
+
+        # A tab switch, or a parameter change for the same homes and years, keeps
+        # the same traces, so patch only their values and the axis labels
+        # instead of resending the whole figure and template
+        triggered = dash.ctx.triggered_prop_ids.keys()
+        if triggered == {"active-chart-tab.data"} or (
+            triggered == {"analysis-results-store.data"} and analysis.get("traces_unchanged")
+        ):
+            patch = dash.Patch()
+            for i, (_, _, y_values, hovertemplate) in enumerate(series):
+                patch["data"][i]["y"] = y_values
+                patch["data"][i]["hovertemplate"] = hovertemplate
+            patch["layout"]["title"]["text"] = config["title"]
+            patch["layout"]["yaxis"]["title"]["text"] = config["yaxis"]
+            patch["layout"]["yaxis"]["tickformat"] = "" if config["field"] == "roi" else "$,.0f"
+            patch["layout"]["uirevision"] = active_tab
+            return patch
+
+        return {
+            "data": [
+                {
+                    "type": "scatter",
+                    "x": data["results"].year,
+                    "y": y_values,
+                    "mode": "lines",
+                    "name": label,
+                    "line": {"color": data["color"], "width": 2},
+                    "hovertemplate": hovertemplate,
+                }
+                for label, data, y_values, hovertemplate in series
+            ],
+            "layout": {
+                **layout,
+                "title": {"text": config["title"]},
+                "yaxis": {
+                    **layout["yaxis"],
+                    "title": {"text": config["yaxis"]},
+                    "tickformat": "" if config["field"] == "roi" else "$,.0f",
+                },
+                # Keep the user's zoom while parameters change; a new tab starts fresh
+                "uirevision": active_tab,
+            },
+        }
 
-        fig.update_layout(
-            title=config["title"],
-            xaxis_title="Year",
-            yaxis_title=config["yaxis"],
-            template=chart_template,
-            height=500,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            hovermode="x unified",
-            autosize=True,
-            yaxis=dict(automargin=False, fixedrange=False),
-            xaxis=dict(automargin=False),
-            margin=dict(l=80, r=40, t=60, b=60),
-            paper_bgcolor=paper_bgcolor,
-            plot_bgcolor=plot_bgcolor,
-        )
+    @app.callback(
+        Output("summary-cards", "children"),
+        Input("analysis-results-store", "data"),
+    )
+    def update_summary_cards(analysis: dict[str, Any] | None) -> list[html.Div] | html.Div:
+        """Build the final-year summary cards from the stored results."""
+        if analysis is None:
+            return html.Div("Select one or more homes to see analysis", className="no-homes-message")
 
-        if config["field"] != "roi":
-            fig.update_yaxes(tickformat="$,.0f")
+        years = analysis["years"]
 
         # Create summary cards for the final year
         summary_cards = []
-        for label, data in all_results.items():
+        for label, data in _load_analysis_results(analysis).items():
             final = data["results"][-1]
             home = data["home"]
             color = data["color"]
 
-            price_str = f"${home['price']:,.0f}"
-            equity_str = f"${final.equity:,.0f}"
-            roi_str = f"{final.roi:.2f}x" if final.roi else "N/A"
-            cash_str = f"${final.total_cash_invested:,.0f}"
+            price_str = _fmt_usd(home["price"])
+            equity_str = _fmt_usd(final.equity)
+            roi_str = _fmt_roi(final.roi) if final.roi else "N/A"
+            cash_str = _fmt_usd(final.total_cash_invested)
 
             summary_cards.append(
                 html.Div([
@@ -1804,7 +1606,20 @@ def register_callbacks(app: dash.Dash) -> None:
                 ], className="summary-card")
             )
 
+        return summary_cards
+
+    @app.callback(
+        Output("analysis-data-table", "children"),
+        [
+            Input("analysis-results-store", "data"),
+            Input("active-chart-tab", "data"),
+        ],
+    )
+    def update_analysis_table(analysis: dict[str, Any] | None, active_tab: str) -> html.Div | list[Any]:
+        """Build the comparison table for the active tab from the stored results."""
+        if analysis is None:
+            return []
+
         # Generate data table based on active tab
-        data_table = generate_data_table(active_tab, all_results, years)
+        return generate_data_table(active_tab, _load_analysis_results(analysis))
 
-        return fig, summary_cards, data_table
@@ -1,10 +1,13 @@
 """Database models and utilities for home data storage."""
 
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text, create_engine
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, create_engine, func, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
@@ -85,8 +88,25 @@ class DatabaseManager:
         return self.session_factory()
 
     def init_db(self) -> None:
-        """Initialize the database, creating tables if they don't exist."""
+        """Initialize the database, creating tables and indexes if they don't exist."""
         Base.metadata.create_all(self.engine)
+        # create_all skips indexes on tables that already exist, so add new ones here
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+    def file_mtime(self) -> int:
+        """Return the database file's modification time in nanoseconds.
+
+        Returns 0 for in-memory databases or a file that does not exist yet.
+        """
+        database = self.engine.url.database
+        if not database or database == ":memory:":
+            return 0
+        try:
+            return Path(database).stat().st_mtime_ns
+        except OSError:
+            return 0
 
     def dispose(self) -> None:
         """Dispose of the engine and release connections."""
@@ -126,6 +146,10 @@ class Home(Base):
     """Model representing a home listing."""
 
     __tablename__ = "homes"
+    __table_args__ = (
+        # Partial index backing the priced-homes queries used by the analysis page
+        Index("idx_homes_price", "price", sqlite_where=text("price IS NOT NULL")),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     address = Column(String(500), nullable=False)
@@ -197,6 +221,76 @@ class Home(Base):
         }
 
 
+@dataclass(frozen=True, slots=True)
+class HomeRecord:
+    """Read-only home row for list views, with one slot per Home.to_dict() key.
+
+    Slots keep thousands of rows far smaller than the equivalent dicts.
+    """
+
+    id: int
+    address: str
+    city: str | None
+    state: str | None
+    zip_code: str | None
+    price: float | None
+    bedrooms: int | None
+    bathrooms: float | None
+    sqft: int | None
+    lot_size: float | None
+    year_built: int | None
+    property_type: str | None
+    latitude: float | None
+    longitude: float | None
+    description: str | None
+    source_url: str | None
+    source_file: str | None
+    imported_at: str | None
+    mls_id: str | None
+    num_rooms: int | None
+    garage_spaces: int | None
+    image_url: str | None
+    video_url: str | None
+    currency: str | None
+    country: str | None
+    property_tax_rate: float | None
+    hoa_monthly: float | None
+    estimated_repair_pct: float | None
+
+
+# Bumped on every write to the homes table so readers can wait for changes
+_homes_version = 0
+_homes_changed = threading.Condition()
+
+
+def get_homes_version() -> int:
+    """Return a counter that increases whenever a home is written in this process."""
+    return _homes_version
+
+
+def _bump_homes_version() -> None:
+    """Record a write to the homes table and wake any waiting readers."""
+    global _homes_version
+    with _homes_changed:
+        _homes_version += 1
+        _homes_changed.notify_all()
+
+
+def get_db_mtime() -> int:
+    """Return the database file's modification time, which also moves on writes from other processes."""
+    return get_db_manager().file_mtime()
+
+
+def wait_for_homes_change(since: int, timeout: float | None = None) -> int:
+    """Block until the homes version differs from ``since`` or ``timeout`` expires.
+
+    Returns the current version, which equals ``since`` on timeout.
+    """
+    with _homes_changed:
+        _homes_changed.wait_for(lambda: _homes_version != since, timeout)
+        return _homes_version
+
+
 def init_db() -> None:
     """Initialize the database, creating tables if they don't exist."""
     get_db_manager().init_db()
@@ -207,12 +301,104 @@ def get_session() -> Session:
     return get_db_manager().get_session()
 
 
-def get_all_homes() -> list[dict[str, Any]]:
+def get_all_homes() -> list[HomeRecord]:
     """Retrieve all homes from the database."""
     session = get_session()
     try:
         homes = session.query(Home).all()
-        return [home.to_dict() for home in homes]
+        return [HomeRecord(**home.to_dict()) for home in homes]
+    finally:
+        session.close()
+
+
+def get_all_homes_minimal(cols: tuple[str, ...] = ("id", "price", "address")) -> list[dict[str, Any]]:
+    """Retrieve only the given columns for homes that have a price.
+
+    Used by views that list homes for selection, so descriptions and other
+    wide columns are never loaded.
+    """
+    session = get_session()
+    try:
+        rows = (
+            session.query(*(getattr(Home, col) for col in cols))
+            .filter(Home.price.isnot(None), Home.price != 0)
+            .order_by(Home.id)
+            .all()
+        )
+        return [dict(zip(cols, row)) for row in rows]
+    finally:
+        session.close()
+
+
+# Columns the paged homes table can show, sort and filter on
+HOME_TABLE_COLUMNS = (
+    "address",
+    "city",
+    "state",
+    "price",
+    "bedrooms",
+    "bathrooms",
+    "sqft",
+    "num_rooms",
+    "garage_spaces",
+    "year_built",
+    "property_type",
+    "mls_id",
+)
+
+_FILTER_OPERATORS = {
+    "=": lambda col, value: col == value,
+    "!=": lambda col, value: col != value,
+    "<": lambda col, value: col < value,
+    "<=": lambda col, value: col <= value,
+    ">": lambda col, value: col > value,
+    ">=": lambda col, value: col >= value,
+    # SQLite's LIKE ignores ASCII case, so the case-sensitive match uses instr()
+    "contains": lambda col, value: func.instr(col, str(value)) > 0,
+    "icontains": lambda col, value: func.lower(col).contains(str(value).lower(), autoescape=True),
+    "i=": lambda col, value: func.lower(col) == str(value).lower(),
+    "i!=": lambda col, value: func.lower(col) != str(value).lower(),
+}
+
+
+def get_homes_page(
+    offset: int,
+    limit: int,
+    sort_by: str | None = None,
+    descending: bool = False,
+    filters: Sequence[tuple[str, str, Any]] = (),
+) -> tuple[list[dict[str, Any]], int]:
+    """Retrieve one page of homes for the homes table, plus the filtered total.
+
+    Args:
+        offset: Number of matching rows to skip.
+        limit: Maximum number of rows to return.
+        sort_by: Column in HOME_TABLE_COLUMNS to order by (defaults to id).
+        descending: Sort in descending order.
+        filters: (column, operator, value) triples; unknown columns or
+            operators are ignored.
+
+    Returns:
+        The page of homes (id plus HOME_TABLE_COLUMNS) and the number of
+        homes matching the filters.
+    """
+    session = get_session()
+    try:
+        query = session.query(Home.id, *(getattr(Home, col) for col in HOME_TABLE_COLUMNS))
+        for column, operator, value in filters:
+            if column in HOME_TABLE_COLUMNS and operator in _FILTER_OPERATORS:
+                query = query.filter(_FILTER_OPERATORS[operator](getattr(Home, column), value))
+
+        total = query.count()
+
+        if sort_by in HOME_TABLE_COLUMNS:
+            order = getattr(Home, sort_by)
+            query = query.order_by(order.desc() if descending else order.asc(), Home.id)
+        else:
+            query = query.order_by(Home.id)
+
+        rows = query.offset(offset).limit(limit).all()
+        return [dict(zip(("id", *HOME_TABLE_COLUMNS), row)) for row in rows], total
     finally:
         session.close()
 
@@ -225,6 +411,7 @@ def add_home(home_data: dict) -> Home:
         session.add(home)
         session.commit()
         session.refresh(home)
+        _bump_homes_version()
         return home
     finally:
         session.close()
@@ -263,3 +450,15 @@ def get_home_by_id(home_id: int) -> dict | None:
         return home.to_dict() if home else None
     finally:
         session.close()
+
+
+def get_homes_by_ids(home_ids: Sequence[int]) -> dict[int, dict]:
+    """Retrieve several homes in one query, keyed by ID (unknown IDs are omitted)."""
+    if not home_ids:
+        return {}
+    session = get_session()
+    try:
+        homes = session.query(Home).filter(Home.id.in_(home_ids)).all()
+        return {home.id: home.to_dict() for home in homes}
+    finally:
+        session.close()
@@ -1,10 +1,18 @@
 """Tests for the cost analysis module."""
 
+from dataclasses import FrozenInstanceError
+
+import numpy as np
 import pytest
 from app.cost_analysis import (
     DEFAULTS,
+    AnalysisColumns,
     CostAnalysisParams,
     YearlyAnalysis,
+    _analysis_columns,
+    _batch_analysis_kernel,
+    _kernel_params,
+    _run_analysis_kernel,
     calculate_loan_balance,
     run_analysis,
     compare_homes,
@@ -123,6 +131,16 @@ class TestCostAnalysisParams:
         params = CostAnalysisParams(home_price=500000, hoa_monthly=250.50)
         assert params.annual_maintenance == 3006
 
+    def test_params_are_immutable(self):
+        """Test that params cannot be reassigned, keeping cached values valid."""
+        params = CostAnalysisParams(home_price=500000)
+        monthly_payment = params.monthly_payment
+        assert "monthly_payment" in params.__dict__
+        assert params.monthly_payment == monthly_payment
+
+        with pytest.raises(FrozenInstanceError):
+            params.home_price = 600000
+
 
 class TestYearlyAnalysis:
     """Tests for the YearlyAnalysis dataclass."""
@@ -143,6 +161,11 @@ class TestYearlyAnalysis:
         )
         assert analysis.roi == 2.0  # 200000 / 100000
 
+    def test_has_no_instance_dict(self):
+        """Test that rows use slots rather than a per-instance __dict__."""
+        analysis = run_analysis(CostAnalysisParams(home_price=500000), years=1)[0]
+        assert not hasattr(analysis, "__dict__")
+
     def test_roi_zero_investment(self):
         """Test ROI when total cash invested is zero."""
         analysis = YearlyAnalysis(
@@ -176,6 +199,36 @@ class TestYearlyAnalysis:
         assert analysis.roi is None
 
 
+class TestAnalysisColumns:
+    """Tests for the AnalysisColumns result container."""
+
+    def test_index_returns_yearly_analysis(self):
+        """Test that indexing a year returns a YearlyAnalysis row."""
+        results = run_analysis(CostAnalysisParams(home_price=500000), years=10)
+
+        assert isinstance(results, AnalysisColumns)
+        assert isinstance(results[3], YearlyAnalysis)
+        assert results[3].year == 3
+        assert results[3].home_value == results.home_value[3]
+        assert results[-1].year == 10
+
+    def test_slice_returns_columns(self):
+        """Test that slicing keeps the columnar layout."""
+        results = run_analysis(CostAnalysisParams(home_price=500000), years=10)
+        tail = results[1:]
+
+        assert isinstance(tail, AnalysisColumns)
+        assert len(tail) == 10
+        assert [r.year for r in tail] == list(range(1, 11))
+
+    def test_roi_column_matches_rows(self):
+        """Test the vectorized ROI column agrees with the per-row property."""
+        results = run_analysis(CostAnalysisParams(home_price=500000), years=10)
+
+        for row, roi in zip(results, results.roi):
+            assert roi == pytest.approx(row.roi)
+
+
 class TestCalculateLoanBalance:
     """Tests for the calculate_loan_balance function."""
 
@@ -384,6 +437,47 @@ class TestRunAnalysis:
             expected = base_maintenance * ((1 + 0.02) ** i)
             assert abs(result.annual_maintenance - expected) < 1
 
+    def test_results_are_memoized(self):
+        """Test that equal params reuse the cached, read-only result."""
+        first = run_analysis(CostAnalysisParams(home_price=450000, hoa_monthly=120), years=12)
+        second = run_analysis(CostAnalysisParams(home_price=450000, hoa_monthly=120), years=12)
+
+        assert first is second
+        with pytest.raises(ValueError):
+            first.home_value[0] = 0
+
+    def test_loan_balance_matches_calculate_loan_balance(self):
+        """Test that the vectorized balances match the scalar formula year by year."""
+        params = CostAnalysisParams(home_price=500000, loan_term_years=15)
+        results = run_analysis(params, years=20)
+
+        for result in results:
+            expected = calculate_loan_balance(
+                params.initial_loan,
+                params.interest_rate,
+                params.loan_term_years,
+                result.year,
+            )
+            assert result.loan_balance == pytest.approx(expected)
+
+    def test_results_are_python_scalars(self):
+        """Test that results hold plain Python numbers rather than NumPy scalars."""
+        params = CostAnalysisParams(home_price=500000)
+        results = run_analysis(params, years=5)
+
+        assert type(results[3].year) is int
+        assert type(results[3].home_value) is float
+
+    def test_results_round_trip_through_dict(self):
+        """Test that to_dict gives plain lists and from_dict restores the columns."""
+        results = run_analysis(CostAnalysisParams(home_price=500000), years=5)
+
+        data = results.to_dict()
+        restored = AnalysisColumns.from_dict(data)
+
+        assert data["year"] == [0, 1, 2, 3, 4, 5]
+        assert list(restored) == list(results)
+
 
 class TestCompareHomes:
     """Tests for the compare_homes function."""
@@ -417,6 +511,37 @@ class TestCompareHomes:
         assert "Single Home" in results
         assert len(results["Single Home"]) == 6
 
+    def test_compare_matches_individual_analysis(self):
+        """Test that the batched comparison matches analyzing each home alone."""
+        homes = [
+            ("Default", CostAnalysisParams(home_price=500000)),
+            ("Cash", CostAnalysisParams(home_price=400000, down_payment_pct=1.0)),
+            ("Interest Free", CostAnalysisParams(home_price=300000, interest_rate=0.0)),
+            ("Short Term", CostAnalysisParams(home_price=600000, loan_term_years=10, hoa_monthly=300)),
+        ]
+
+        results = compare_homes(homes, years=20)
+
+        for name, params in homes:
+            expected = run_analysis(params, years=20)
+            for field in ("year", "home_value", "loan_balance", "total_cash_invested", "annual_maintenance"):
+                np.testing.assert_allclose(
+                    getattr(results[name], field), getattr(expected, field), rtol=1e-9, atol=1e-6
+                )
+
+    def test_compare_repeated_call_is_cached(self):
+        """Test that repeating a comparison returns the cached analyses."""
+        homes = [
+            ("Home A", CostAnalysisParams(home_price=410000)),
+            ("Home B", CostAnalysisParams(home_price=520000)),
+        ]
+
+        first = compare_homes(homes, years=15)
+        second = compare_homes(homes, years=15)
+
+        assert first["Home A"] is second["Home A"]
+        assert first["Home B"] is second["Home B"]
+
     def test_compare_empty_list(self):
         """Test comparing an empty list of homes."""
         results = compare_homes([], years=10)
@@ -485,6 +610,13 @@ class TestGetAnalysisSummary:
         assert summary["total_repair_costs"] > 0
         assert summary["total_maintenance"] > 0
 
+        # Totals cover years 1-5 only; year 0 has no annual costs
+        assert summary["total_taxes_paid"] == pytest.approx(sum(r.annual_taxes for r in results[1:]))
+        assert summary["total_repair_costs"] == pytest.approx(sum(r.annual_repair for r in results[1:]))
+        assert summary["total_maintenance"] == pytest.approx(
+            sum(r.annual_maintenance for r in results[1:])
+        )
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -680,3 +812,44 @@ class TestFinancialAccuracy:
             if result.total_cash_invested > 0:
                 expected_roi = result.equity / result.total_cash_invested
                 assert abs(result.roi - expected_roi) < 0.0001
+
+
+class TestAnalysisKernel:
+    """Tests that the loop kernel and the NumPy implementation agree."""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"down_payment_pct": 1.0},
+            {"interest_rate": 0.0},
+            {"loan_term_years": 10, "hoa_monthly": 400},
+            {"annual_growth_rate": -0.02, "maintenance_inflation": 0.05},
+        ],
+    )
+    def test_kernel_matches_numpy_columns(self, overrides):
+        """Test the kernel reproduces the vectorized columns."""
+        params = CostAnalysisParams(home_price=500000, **overrides)
+        years = 35
+
+        expected = _analysis_columns(params, years)
+        actual = _run_analysis_kernel(_kernel_params([params])[0], years)
+
+        assert len(actual) == len(expected)
+        for actual_column, expected_column in zip(actual, expected):
+            np.testing.assert_allclose(actual_column, expected_column, rtol=1e-9, atol=1e-6)
+
+    def test_batch_kernel_matches_single_kernel(self):
+        """Test the per-home batch kernel fills the same rows as the single-home kernel."""
+        homes = [
+            CostAnalysisParams(home_price=500000),
+            CostAnalysisParams(home_price=300000, interest_rate=0.0, hoa_monthly=250),
+            CostAnalysisParams(home_price=800000, down_payment_pct=1.0),
+        ]
+
+        batch = _batch_analysis_kernel(_kernel_params(homes), 30)
+
+        assert batch.shape == (9, 3, 31)
+        for h, params in enumerate(homes):
+            single = _run_analysis_kernel(_kernel_params([params])[0], 30)
+            np.testing.assert_allclose(batch[:, h], single)
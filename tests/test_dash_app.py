@@ -0,0 +1,308 @@
+"""Tests for the Dash application layouts and helpers."""
+
+import pytest
+
+# Skip all tests in this module if dash is not installed
+dash = pytest.importorskip("dash")
+
+# Import at collection time: the autouse geopy fixture patches sys.modules,
+# and extension modules (numpy) cannot be re-imported once dropped from it
+from app import dash_app  # noqa: E402
+from app.database import Home, add_home  # noqa: E402
+
+
+class TestHomeDetailLayout:
+    """Tests for create_home_detail_layout."""
+
+    def test_missing_home_shows_not_found(self, temp_db):
+        """Test that an unknown home ID renders the not-found message."""
+        layout = dash_app.create_home_detail_layout(999)
+
+        assert layout.children[1].className == "not-found"
+
+    def test_layout_is_memoized_per_row(self, temp_db):
+        """Test that repeat visits reuse the layout until the row changes."""
+        home = add_home({"address": "123 Main St", "price": 500000.0})
+
+        first = dash_app.create_home_detail_layout(home.id)
+        assert dash_app.create_home_detail_layout(home.id) is first
+
+        temp_db.query(Home).filter(Home.id == home.id).update({"price": 450000.0})
+        temp_db.commit()
+
+        assert dash_app.create_home_detail_layout(home.id) is not first
+
+
+class TestCostAnalysisLayout:
+    """Tests for create_cost_analysis_layout."""
+
+    def test_layout_is_memoized_until_homes_change(self, temp_db):
+        """Test that repeat visits reuse the layout until a selectable home changes."""
+        home = add_home({"address": "123 Main St", "price": 500000.0})
+
+        first = dash_app.create_cost_analysis_layout()
+        assert dash_app.create_cost_analysis_layout() is first
+
+        temp_db.query(Home).filter(Home.id == home.id).update({"price": 450000.0})
+        temp_db.commit()
+
+        assert dash_app.create_cost_analysis_layout() is not first
+
+    def test_selector_labels_escape_markdown(self, temp_db):
+        """Test that selector labels truncate the address before escaping it."""
+        add_home({"address": "[Unit 5] " + "x" * 40, "price": 500000.0})
+
+        layout = dash_app.create_cost_analysis_layout()
+        table = next(c for c in layout._traverse() if getattr(c, "id", None) == "home-select-table")
+
+        assert table.data[0]["label"].startswith("[\\[Unit 5\\] " + "x" * 31 + " - $500,000]")
+
+
+class TestIndexPage:
+    """Tests for the app's index template."""
+
+    def test_theme_is_set_in_head_before_first_paint(self, temp_db):
+        """Test that the saved theme is applied by an inline <head> script, ahead of the assets."""
+        page = dash_app.create_app().server.test_client().get("/").get_data(as_text=True)
+
+        head = page.split("</head>", 1)[0]
+        assert "setAttribute('data-theme', 'dark')" in head
+        assert "theme.js" not in head
+
+    def test_page_is_compressed(self, temp_db):
+        """Test that responses are gzipped for clients that accept it."""
+        client = dash_app.create_app().server.test_client()
+
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    def test_template_is_shared_across_apps(self, temp_db):
+        """Test that every app reuses the module-level template instead of building its own."""
+        assert dash_app.create_app().index_string is dash_app._INDEX_STRING
+
+
+class TestHomesList:
+    """Tests for the paged homes table callback."""
+
+    @staticmethod
+    def _update_homes_list():
+        app = dash_app.create_app()
+        key = "..homes-list.data...homes-list.page_count...homes-list-empty.style.."
+        return app.callback_map[key]["callback"].__wrapped__
+
+    def test_empty_database_shows_import_hint(self, temp_db):
+        """Test that the import hint is shown only while the database has no homes."""
+        update_homes_list = self._update_homes_list()
+
+        rows, page_count, empty_style = update_homes_list(None, 0, 50, [], "")
+        assert (rows, page_count, empty_style) == ([], 1, {})
+
+        *_, filtered_style = update_homes_list(None, 0, 50, [], "{city} scontains Nowhere")
+        assert filtered_style == {"display": "none"}
+
+        add_home({"address": "123 Main St", "price": 500000.0})
+        rows, _, empty_style = update_homes_list(None, 0, 50, [], "")
+        assert rows[0]["address"] == f"[123 Main St](/home/{rows[0]['id']})"
+        assert empty_style == {"display": "none"}
+
+
+class TestHomesApi:
+    """Tests for the /api/homes route."""
+
+    def test_homes_api_revalidates_with_etag(self, temp_db):
+        """Test that /api/homes serves JSON and answers 304 for a matching ETag."""
+        add_home({"address": "123 Main St", "price": 500000.0})
+        dash_app._invalidate_homes_cache()
+        client = dash_app.create_app().server.test_client()
+
+        response = client.get("/api/homes")
+        assert response.status_code == 200
+        assert [h["address"] for h in response.get_json()] == ["123 Main St"]
+
+        etag = response.headers["ETag"]
+        assert client.get("/api/homes", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_homes_api_and_assets_are_compressed(self, temp_db):
+        """Test that the JSON routes and the stylesheet are served brotli-encoded."""
+        for i in range(20):
+            add_home({"address": f"{i} Main St", "price": 500000.0})
+        dash_app._invalidate_homes_cache()
+        client = dash_app.create_app().server.test_client()
+
+        for path in ("/api/homes", "/assets/app.css"):
+            response = client.get(path, headers={"Accept-Encoding": "br"})
+            assert response.headers["Content-Encoding"] == "br"
+
+    def test_geojson_route_serves_markers(self, temp_db):
+        """Test that /api/homes.geojson serves a FeatureCollection of located homes."""
+        add_home({"address": "1 <b>Map</b> St", "price": 500000.0, "latitude": 49.2000004, "longitude": -123.1000004})
+        add_home({"address": "2 Nowhere Rd", "price": 400000.0})
+        dash_app._invalidate_homes_cache()
+        client = dash_app.create_app().server.test_client()
+
+        response = client.get("/api/homes.geojson")
+        (feature,) = response.get_json()["features"]
+
+        assert feature["geometry"]["coordinates"] == [-123.1, 49.2]
+        assert feature["properties"]["tooltip"] == "1 &lt;b&gt;Map&lt;/b&gt; St"
+        etag = response.headers["ETag"]
+        assert client.get("/api/homes.geojson", headers={"If-None-Match": etag}).status_code == 304
+
+
+class TestHomesEvents:
+    """Tests for the /events stream."""
+
+    def test_stream_ends_and_reports_changes_missed_while_reconnecting(self, temp_db, monkeypatch):
+        """Test that a stream closes after its lifetime and a reconnect reports a stale Last-Event-ID."""
+        monkeypatch.setattr(dash_app, "_EVENTS_STREAM_SECONDS", 0)
+        client = dash_app.create_app().server.test_client()
+
+        first = client.get("/events").get_data(as_text=True)
+        assert first.startswith("retry: 5000\nid: ")
+        assert "homes-updated" not in first
+
+        event_id = first.split("id: ", 1)[1].split("\n", 1)[0]
+        add_home({"address": "123 Main St", "price": 500000.0})
+
+        resumed = client.get("/events", headers={"Last-Event-ID": event_id}).get_data(as_text=True)
+        assert "event: homes-updated" in resumed
+
+
+class TestCachedHomes:
+    """Tests for the shared homes cache."""
+
+    def test_cache_is_reused_until_the_database_changes(self, temp_db):
+        """Test that _cached_homes re-queries only after a write or a file mtime change."""
+        import os
+
+        from app.database import get_db_manager
+
+        add_home({"address": "123 Main St", "price": 500000.0})
+        first, _ = dash_app._cached_homes()
+        assert dash_app._cached_homes()[0] is first
+
+        add_home({"address": "456 Oak Ave", "price": 600000.0})
+        second, _ = dash_app._cached_homes()
+        assert len(second) == 2
+
+        # A write from another process only shows up as a new file mtime
+        path = get_db_manager().engine.url.database
+        os.utime(path, ns=(1, 1))
+        assert dash_app._cached_homes()[0] is not second
+
+    def test_homes_data_update_skips_unchanged_digest(self, temp_db):
+        """Test that refreshing homes-data is skipped when no row changed."""
+        from dash.exceptions import PreventUpdate
+
+        add_home({"address": "123 Main St", "price": 500000.0})
+        current = dash_app._homes_data_update(None)
+
+        with pytest.raises(PreventUpdate):
+            dash_app._homes_data_update(current)
+
+        add_home({"address": "456 Oak Ave", "price": 600000.0})
+        assert dash_app._homes_data_update(current) != current
+
+
+class TestComputeAnalysis:
+    """Tests for the cost analysis callback."""
+
+    def test_rerun_when_a_selected_home_changes(self, temp_db):
+        """Test that unchanged inputs are skipped only while the homes are unchanged too."""
+        from dash.exceptions import PreventUpdate
+
+        home_id = add_home({"address": "123 Main St", "price": 500000.0}).id
+        compute_analysis = dash_app.create_app().callback_map["analysis-results-store.data"]["callback"].__wrapped__
+        inputs = (10, 20, 4.79, 30, 35000, 3, 0.03, 2, [home_id])
+
+        first = compute_analysis(*inputs, None)
+        with pytest.raises(PreventUpdate):
+            compute_analysis(*inputs, first)
+
+        temp_db.query(Home).filter(Home.id == home_id).update({"price": 600000.0})
+        temp_db.commit()
+        dash_app._invalidate_homes_cache()
+
+        second = compute_analysis(*inputs, first)
+        assert second["homes"][0]["home"]["price"] == 600000.0
+
+
+class TestFilterQuery:
+    """Tests for _parse_filter_query."""
+
+    def test_parses_table_filter_expressions(self):
+        """Test that DataTable filter expressions become (column, operator, value) triples."""
+        query = '{price} >= 400000 && {city} contains "Van" && {mls_id} eq R1'
+
+        assert dash_app._parse_filter_query(query) == [
+            ("price", ">=", 400000.0),
+            ("city", "contains", "Van"),
+            ("mls_id", "=", "R1"),
+        ]
+
+    def test_parses_case_prefixed_operators(self):
+        """Test that the "s"/"i" operator prefixes the table emits are understood."""
+        query = "{city} scontains Van && {city} icontains van && {state} s= BC && {mls_id} contains 12345"
+
+        assert dash_app._parse_filter_query(query) == [
+            ("city", "contains", "Van"),
+            ("city", "icontains", "van"),
+            ("state", "=", "BC"),
+            ("mls_id", "contains", "12345"),
+        ]
+
+    def test_empty_query_has_no_filters(self):
+        """Test that an empty or missing filter query yields no filters."""
+        assert dash_app._parse_filter_query("") == []
+        assert dash_app._parse_filter_query(None) == []
+
+
+class TestEscapeMarkdown:
+    """Tests for _escape_markdown."""
+
+    def test_escapes_inline_markdown(self):
+        """Test that link brackets, emphasis and code markers in scraped text are escaped."""
+        assert dash_app._escape_markdown("Unit [2] *Lot_5* `A`") == r"Unit \[2\] \*Lot\_5\* \`A\`"
+
+
+class TestMapViewport:
+    """Tests for _map_viewport."""
+
+    def test_fits_located_homes(self, temp_db):
+        """Test that the viewport centers on located homes and zooms to their spread."""
+        from app.database import get_all_homes
+
+        add_home({"address": "1 A St", "latitude": 49.0, "longitude": -123.0})
+        add_home({"address": "2 B St", "latitude": 49.02, "longitude": -123.02})
+        add_home({"address": "3 C St"})
+
+        viewport = dash_app._map_viewport(get_all_homes())
+
+        assert viewport["center"] == pytest.approx([49.01, -123.01])
+        assert viewport["zoom"] == 13
+
+    def test_no_located_homes_shows_default_view(self):
+        """Test that an empty list falls back to the default North America view."""
+        assert dash_app._map_viewport([])["zoom"] == 4
+
+
+class TestOrjsonProvider:
+    """Tests for the orjson-backed Flask JSON provider."""
+
+    def test_provider_handles_numpy_and_dates(self):
+        """Test that the provider encodes numpy scalars, non-string keys and dates."""
+        from datetime import date
+
+        import flask
+        import numpy as np
+
+        provider = dash_app.OrjsonProvider(flask.Flask(__name__))
+
+        encoded = provider.dumps({"price": np.float64(1.5), 2: date(2024, 1, 2)})
+
+        assert provider.loads(encoded) == {"price": 1.5, "2": "2024-01-02"}
+
+    def test_app_serves_json_with_orjson(self, temp_db):
+        """Test that the app's Flask server uses the orjson provider."""
+        assert isinstance(dash_app.create_app().server.json, dash_app.OrjsonProvider)
@@ -1,5 +1,6 @@
 """Tests for the database models."""
 
+import os
 from datetime import datetime
 
 import pytest
@@ -7,6 +8,22 @@ import pytest
 # Skip all tests in this module if sqlalchemy is not installed
 sqlalchemy = pytest.importorskip("sqlalchemy")
 
+from sqlalchemy import inspect  # noqa: E402
+
+from app.database import (  # noqa: E402
+    DatabaseManager,
+    HomeRecord,
+    add_home,
+    get_all_homes,
+    get_all_homes_minimal,
+    get_db_manager,
+    get_db_mtime,
+    get_homes_by_ids,
+    get_homes_page,
+    get_homes_version,
+    wait_for_homes_change,
+)
+
 
 class TestHomeModel:
     """Tests for the Home database model."""
@@ -476,4 +493,113 @@ class TestDuplicateDetection:
 
         # Test: Same address without MLS ID should be caught by address check
         assert database.home_exists("123 Main St", "different.html", None) is True
-        reset_db_manager()
\ No newline at end of file
+        reset_db_manager()
+
+
+class TestHomeQueries:
+    """Tests for the read helpers used by the Dash views."""
+
+    def test_minimal_query_projects_priced_homes(self, temp_db):
+        """Test that get_all_homes_minimal returns only priced homes and requested columns."""
+        add_home({"address": "1 Priced St", "price": 500000.0, "description": "long text"})
+        add_home({"address": "2 Unpriced St"})
+        add_home({"address": "3 Zero St", "price": 0.0})
+
+        homes = get_all_homes_minimal()
+
+        assert len(homes) == 1
+        assert homes[0]["address"] == "1 Priced St"
+        assert set(homes[0]) == {"id", "price", "address"}
+
+    def test_minimal_query_keeps_insertion_order(self, temp_db):
+        """Test that get_all_homes_minimal lists homes by id, not by the price index."""
+        add_home({"address": "1 Dear St", "price": 900000.0})
+        add_home({"address": "2 Cheap St", "price": 100000.0})
+        add_home({"address": "3 Middle St", "price": 500000.0})
+
+        homes = get_all_homes_minimal()
+
+        assert [home["address"] for home in homes] == ["1 Dear St", "2 Cheap St", "3 Middle St"]
+
+    def test_init_db_adds_price_index_to_existing_table(self, tmp_path):
+        """Test that init_db creates the price index on a database created before it existed."""
+        db_manager = DatabaseManager(db_path=tmp_path / "old.db")
+        db_manager.init_db()
+        with db_manager.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX idx_homes_price")
+
+        db_manager.init_db()
+
+        indexes = {idx["name"] for idx in inspect(db_manager.engine).get_indexes("homes")}
+        assert "idx_homes_price" in indexes
+        db_manager.dispose()
+
+    def test_add_home_bumps_homes_version(self, temp_db):
+        """Test that adding a home advances the version readers wait on."""
+        before = get_homes_version()
+        add_home({"address": "1 Version St"})
+
+        assert get_homes_version() == before + 1
+        assert wait_for_homes_change(before, timeout=0) == before + 1
+        assert wait_for_homes_change(before + 1, timeout=0) == before + 1
+
+    def test_homes_page_sorts_filters_and_counts(self, temp_db):
+        """Test that get_homes_page pages in SQL and reports the filtered total."""
+        for i in range(5):
+            add_home({"address": f"{i} Page St", "city": "Squamish" if i % 2 else "Whistler", "price": 100000.0 * (i + 1)})
+
+        homes, total = get_homes_page(0, 2, sort_by="price", descending=True)
+        assert total == 5
+        assert [h["price"] for h in homes] == [500000.0, 400000.0]
+
+        homes, total = get_homes_page(0, 10, filters=[("city", "contains", "quam"), ("price", ">", 200000.0)])
+        assert total == 1
+        assert homes[0]["address"] == "3 Page St"
+
+    def test_homes_page_filters_respect_case(self, temp_db):
+        """Test that plain filters match case-sensitively and "i" filters do not."""
+        add_home({"address": "1 Case St", "city": "Squamish", "mls_id": "R12345"})
+
+        assert get_homes_page(0, 10, filters=[("city", "contains", "squam")])[1] == 0
+        assert get_homes_page(0, 10, filters=[("city", "icontains", "squam")])[1] == 1
+        assert get_homes_page(0, 10, filters=[("city", "i=", "SQUAMISH")])[1] == 1
+        assert get_homes_page(0, 10, filters=[("mls_id", "contains", "12345")])[1] == 1
+
+    def test_homes_page_ignores_unknown_columns(self, temp_db):
+        """Test that sort and filter columns outside the table whitelist are ignored."""
+        add_home({"address": "1 Safe St", "description": "secret"})
+
+        homes, total = get_homes_page(0, 10, sort_by="raw_html", filters=[("description", "=", "secret"), ("address", "drop", 1)])
+
+        assert total == 1
+        assert "description" not in homes[0]
+
+    def test_get_all_homes_returns_compact_records(self, temp_db):
+        """Test that get_all_homes returns slotted records matching to_dict()."""
+        add_home({"address": "1 Record St", "price": 250000.0, "latitude": 49.1})
+
+        (home,) = get_all_homes()
+
+        assert isinstance(home, HomeRecord)
+        assert not hasattr(home, "__dict__")
+        assert (home.address, home.price, home.latitude) == ("1 Record St", 250000.0, 49.1)
+
+    def test_get_homes_by_ids_fetches_in_one_call(self, temp_db):
+        """Test that get_homes_by_ids keys homes by ID and omits unknown IDs."""
+        first = add_home({"address": "1 Batch St", "price": 300000.0})
+        second = add_home({"address": "2 Batch St", "price": 400000.0})
+
+        homes = get_homes_by_ids([second.id, first.id, 999])
+
+        assert set(homes) == {first.id, second.id}
+        assert homes[second.id]["address"] == "2 Batch St"
+        assert get_homes_by_ids([]) == {}
+
+    def test_db_mtime_follows_the_database_file(self, temp_db):
+        """Test that get_db_mtime reads the file's mtime and is 0 for in-memory databases."""
+        path = get_db_manager().engine.url.database
+        before = get_db_mtime()
+        os.utime(path, ns=(before - 10**9, before - 10**9))
+
+        assert get_db_mtime() != before
+        assert DatabaseManager(db_url="sqlite://").file_mtime() == 0